@@ -4,3 +4,42 @@ Integrations Module
 External service integrations (Gmail, Discord, etc.)
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .linkedin_client import (
+        LinkedInClient,
+        LinkedInMessageError,
+        LinkedInAuthError,
+        LinkedInRateLimitError,
+        get_linkedin_client,
+        reset_linkedin_client,
+        clear_linkedin_caches,
+    )
+
+# Names re-exported lazily (PEP 562) so the client module is only loaded
+# when something actually touches it.
+_LAZY_EXPORTS = {
+    "LinkedInClient": "linkedin_client",
+    "LinkedInMessageError": "linkedin_client",
+    "LinkedInAuthError": "linkedin_client",
+    "LinkedInRateLimitError": "linkedin_client",
+    "get_linkedin_client": "linkedin_client",
+    "reset_linkedin_client": "linkedin_client",
+    "clear_linkedin_caches": "linkedin_client",
+}
+
+
+def __getattr__(name: str):
+    """Resolve integration submodules and LinkedIn exports on first access."""
+    if name == "linkedin_client":
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f".{module_name}", __name__)
+        value = getattr(module, name)
+        # Bind it here so later lookups skip __getattr__ entirely
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
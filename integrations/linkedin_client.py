@@ -4,47 +4,113 @@ LinkedIn Client
 Client for interacting with LinkedIn via the unofficial linkedin-api library.
 Supports profile lookups, searches, messaging, and connection management.
 
-Authentication:
-    1. Username/password login (may trigger 2FA/challenge)
+Authentication (tried in this order):
+    1. Environment variables (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID)
     2. Browser cookies (li_at, JSESSIONID) from Brave/Chrome/Firefox/Edge
-    3. Environment variables (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID)
+    3. Username/password login (may trigger 2FA/challenge)
 
 IMPORTANT: This uses an unofficial API. Be conservative with rate limits
 to avoid account restrictions.
 """
 
 import os
-import sys
+import re
 import json
-import uuid
+import time
+import random
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator, Tuple, TYPE_CHECKING
 
-from requests.cookies import RequestsCookieJar
+from utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from requests.cookies import RequestsCookieJar
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj).encode()
 
 logger = logging.getLogger(__name__)
 
+# On-disk caches (survive restarts)
+_CACHE_DIR = Path(__file__).parent.parent / "data" / "linkedin"
+_PROFILE_CACHE_PATH = _CACHE_DIR / "me.json"
+_PROFILE_CACHE_TTL = 86400  # 24 hours
+_COOKIE_CACHE_PATH = _CACHE_DIR / "cookies.json"
+_COOKIE_CACHE_TTL = 3600  # 1 hour
+_SESSION_CACHE_PATH = _CACHE_DIR / "session.json"
+
+# In-process cache for profile/contact/connection lookups
+_LOOKUP_CACHE_TTL = float(os.getenv("LINKEDIN_PROFILE_CACHE_TTL", "3600"))
+_LOOKUP_CACHE_SIZE = 1024
+
+# Bulk profile lookups: retries on 429 with jittered exponential backoff
+_BULK_MAX_RETRIES = 3
+_BULK_BACKOFF_SECONDS = 5.0
+
+# Quotes/backslashes wrapped around a JSESSIONID value (e.g. "\"ajax:123\"")
+_JSESSION_RE = re.compile(r'''^['"\\]*(.*?)['"\\]*$''', re.DOTALL)
+
+# In-memory copy of the browser cookie cache
+_cookie_cache: Dict[str, Any] = {"jar": None, "expires": 0}
+
+# LinkedIn auth settings, read from the environment once per process
+_ENV: Dict[str, Optional[str]] = {}
+
+
+def refresh_env():
+    """Re-read LinkedIn auth settings from the environment."""
+    _ENV["LI_AT"] = os.getenv("LINKEDIN_LI_AT")
+    _ENV["JSESSIONID"] = os.getenv("LINKEDIN_JSESSIONID")
+    _ENV["EMAIL"] = os.getenv("LINKEDIN_EMAIL")
+    _ENV["PASSWORD"] = os.getenv("LINKEDIN_PASSWORD")
+
+
+def _get_env() -> Dict[str, Optional[str]]:
+    """Get the cached LinkedIn auth settings, reading them on first use."""
+    if not _ENV:
+        refresh_env()
+    return _ENV
+
+
 # Lazy imports for linkedin-api (may not be installed)
+# requests is deferred too, so importing this module stays cheap when unused.
 Linkedin = None
-generate_trackingId_as_charString = None
 browser_cookie3 = None
+RequestsCookieJar = None
 
 
 def _ensure_imports():
     """Lazily import linkedin-api dependencies."""
-    global Linkedin, generate_trackingId_as_charString, browser_cookie3
+    global Linkedin, RequestsCookieJar
+    
+    if RequestsCookieJar is None:
+        from requests.cookies import RequestsCookieJar as _RCJ
+        RequestsCookieJar = _RCJ
     
     if Linkedin is None:
         try:
             from linkedin_api import Linkedin as _Linkedin
-            from linkedin_api.linkedin import generate_trackingId_as_charString as _gen_tracking
             Linkedin = _Linkedin
-            generate_trackingId_as_charString = _gen_tracking
         except ImportError:
             raise ImportError(
                 "linkedin-api library not installed. "
                 "Install with: pip install linkedin-api"
             )
+
+
+def _ensure_browser_cookie3():
+    """Lazily import browser_cookie3 (only needed for browser cookie auth)."""
+    global browser_cookie3
     
     if browser_cookie3 is None:
         try:
@@ -54,6 +120,157 @@ def _ensure_imports():
             logger.warning("browser_cookie3 not installed - browser cookie auth unavailable")
 
 
+def _tracking_id() -> str:
+    """
+    Generate a message trackingId.
+    
+    Same format as linkedin-api's generate_trackingId_as_charString:
+    16 random bytes, one character per byte.
+    """
+    return os.urandom(16).decode("latin-1")
+
+
+def _build_message_templates() -> Tuple[bytes, bytes]:
+    """
+    Serialize the static parts of the send-message payloads once.
+    
+    Per-message values are JSON string placeholders that
+    _render_message_payload swaps for the real (JSON-encoded) values.
+    
+    Returns:
+        Tuple of (reply event template, new conversation template)
+    """
+    message_event = {
+        "eventCreate": {
+            "originToken": "__ORIGIN_TOKEN__",
+            "value": {
+                "com.linkedin.voyager.messaging.create.MessageCreate": {
+                    "attributedBody": {
+                        "text": "__TEXT__",
+                        "attributes": [],
+                    },
+                    "attachments": [],
+                }
+            },
+            "trackingId": "__TRACKING_ID__",
+        },
+        "dedupeByClientGeneratedToken": False,
+    }
+    reply_template = _dumps(message_event)
+    
+    message_event["recipients"] = "__RECIPIENTS__"
+    message_event["subtype"] = "MEMBER_TO_MEMBER"
+    create_template = _dumps({
+        "keyVersion": "LEGACY_INBOX",
+        "conversationCreate": message_event,
+    })
+    return reply_template, create_template
+
+
+_MESSAGE_EVENT_TEMPLATE, _CONVERSATION_CREATE_TEMPLATE = _build_message_templates()
+
+
+def _render_message_payload(
+    template: bytes,
+    message_body: str,
+    recipients: Optional[List[str]] = None
+) -> bytes:
+    """Fill a send-message template with per-message values (JSON bytes)."""
+    # Imported here: uuid pulls in platform and is only needed to send
+    # (orjson imports it anyway, so this only helps the json fallback)
+    import uuid
+    
+    payload = template.replace(b'"__ORIGIN_TOKEN__"', _dumps(str(uuid.uuid4())))
+    payload = payload.replace(b'"__TRACKING_ID__"', _dumps(_tracking_id()))
+    if recipients is not None:
+        payload = payload.replace(b'"__RECIPIENTS__"', _dumps(recipients))
+    # Message text goes in last so its contents are never scanned for placeholders
+    return payload.replace(b'"__TEXT__"', _dumps(message_body))
+
+
+def _auth_key_for(secret: str) -> str:
+    """Derive a short, non-reversible cache key from an auth secret."""
+    return hashlib.sha1(secret.encode()).hexdigest()[:16]
+
+
+def _load_profile_cache(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the cached own-profile entry for an auth key.
+    
+    Returns:
+        Dict with 'profile' and 'urn' keys, or None on miss/expiry
+    """
+    try:
+        with open(_PROFILE_CACHE_PATH, 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if entry.get("key") != key or entry.get("expires", 0) < time.time():
+        return None
+    return entry
+
+
+def _save_profile_cache(key: str, data: Dict[str, Any], ttl: int = _PROFILE_CACHE_TTL):
+    """Persist the own-profile entry for an auth key."""
+    entry = {"key": key, "expires": time.time() + ttl, **data}
+    _write_private_json(_PROFILE_CACHE_PATH, entry)
+
+
+def _remove_cache_file(path: Path):
+    """Delete a cache file, ignoring it if already gone."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug("Failed to delete cache file %s: %s", path.name, e)
+
+
+def _write_private_json(path: Path, data: Dict[str, Any]):
+    """Atomically write a JSON cache file readable only by the current user."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Failed to write cache file %s: %s", path.name, e)
+
+
+def _clear_profile_cache():
+    """Delete the on-disk own-profile cache."""
+    _remove_cache_file(_PROFILE_CACHE_PATH)
+
+
+def _raise_for_api_error(result: Any):
+    """
+    Raise if linkedin-api handed back an error payload instead of data.
+    
+    Error responses look like {"message": ..., "status": ...}.
+    
+    Raises:
+        LinkedInAuthError: If the API rejected the session (HTTP 401/403)
+        LinkedInRateLimitError: If the API responded with HTTP 429
+        ValueError: If the result is any other API error response
+    """
+    try:
+        message = result.get("message")
+        status = result.get("status")
+        if message and status:
+            if status in (401, 403):
+                _invalidate_session()
+                raise LinkedInAuthError(f"LinkedIn API error: {message}")
+            if status == 429:
+                raise LinkedInRateLimitError(f"LinkedIn API error: {message}")
+            raise ValueError(f"LinkedIn API error: {message}")
+    except AttributeError:
+        # Not a dict - nothing to check
+        pass
+
+
 class LinkedInMessageError(Exception):
     """Custom exception for LinkedIn messaging errors."""
     pass
@@ -64,6 +281,11 @@ class LinkedInAuthError(Exception):
     pass
 
 
+class LinkedInRateLimitError(ValueError):
+    """Raised when LinkedIn throttles a request (HTTP 429)."""
+    pass
+
+
 class LinkedInClient:
     """
     Client wrapper for LinkedIn API operations.
@@ -71,15 +293,26 @@ class LinkedInClient:
     Handles authentication and provides clean methods for common operations.
     """
     
-    def __init__(self, client):
+    def __init__(self, client, auth_key: Optional[str] = None):
         """
         Initialize with an authenticated linkedin-api client.
         
         Args:
             client: Authenticated Linkedin client instance
+            auth_key: Key identifying the session, used for the on-disk
+                profile cache (None disables disk caching)
         """
         self._client = client
+        self._auth_key = auth_key
         self._my_profile = None
+        self._my_urn = None
+        
+        # Lookup caches keyed by lookup_key() / urn_id. These are the only
+        # layer of lookup caching; callers that rate-limit their requests
+        # check cached_*() first so hits don't spend a request slot.
+        self._profile_cache = TTLCache(maxsize=_LOOKUP_CACHE_SIZE, ttl=_LOOKUP_CACHE_TTL)
+        self._contact_cache = TTLCache(maxsize=_LOOKUP_CACHE_SIZE, ttl=_LOOKUP_CACHE_TTL)
+        self._conn_cache = TTLCache(maxsize=_LOOKUP_CACHE_SIZE, ttl=_LOOKUP_CACHE_TTL)
     
     # ============ Profile Operations ============
     
@@ -91,6 +324,8 @@ class LinkedInClient:
         """
         Get a LinkedIn profile.
         
+        Successful lookups are cached for LINKEDIN_PROFILE_CACHE_TTL seconds.
+        
         Args:
             public_id: Public profile ID (e.g., "john-doe-123456")
             urn_id: URN ID (e.g., "ACoAABxxxx")
@@ -104,16 +339,18 @@ class LinkedInClient:
         if not public_id and not urn_id:
             raise ValueError("Must provide either public_id or urn_id")
         
+        key = self.lookup_key(public_id, urn_id)
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            return cached
+        
         result = self._client.get_profile(public_id=public_id, urn_id=urn_id)
         
-        # Check if API returned an error response
-        if isinstance(result, dict):
-            if "message" in result and "status" in result:
-                # API error response
-                raise ValueError(f"LinkedIn API error: {result.get('message', 'Unknown error')}")
-            if not result:
-                raise ValueError("Profile not found or empty response")
+        _raise_for_api_error(result)
+        if not result:
+            raise ValueError("Profile not found or empty response")
         
+        self._profile_cache.set(key, result)
         return result
     
     def get_profile_contact_info(
@@ -134,10 +371,162 @@ class LinkedInClient:
         if not public_id and not urn_id:
             raise ValueError("Must provide either public_id or urn_id")
         
-        return self._client.get_profile_contact_info(
+        key = self.lookup_key(public_id, urn_id)
+        cached = self._contact_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        result = self._client.get_profile_contact_info(
             public_id=public_id,
             urn_id=urn_id
         )
+        
+        _raise_for_api_error(result)
+        self._contact_cache.set(key, result)
+        return result
+    
+    def invalidate_profile(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None
+    ):
+        """
+        Evict cached profile, contact info and connections for a profile.
+        
+        Args:
+            public_id: Public profile ID
+            urn_id: URN ID
+        """
+        keys = []
+        if urn_id:
+            keys.append(self.lookup_key(None, urn_id))
+        if public_id:
+            keys.append(self.lookup_key(public_id, None))
+        for key in keys:
+            self._profile_cache.pop(key)
+            self._contact_cache.pop(key)
+        if urn_id:
+            self._conn_cache.pop(urn_id)
+    
+    @staticmethod
+    def lookup_key(public_id: Optional[str], urn_id: Optional[str]) -> Tuple[str, str]:
+        """
+        Normalize profile identifiers into a lookup cache key.
+        
+        URN IDs are preferred when both are given. Public IDs are
+        case-insensitive on LinkedIn; URN IDs are not.
+        """
+        urn_id = (urn_id or "").strip()
+        if urn_id:
+            return ("urn", urn_id)
+        return ("public", (public_id or "").strip().lower())
+    
+    def cached_profile(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached get_profile() result without calling the API (None on a miss)."""
+        return self._profile_cache.get(self.lookup_key(public_id, urn_id))
+    
+    def cached_contact_info(
+        self,
+        public_id: Optional[str] = None,
+        urn_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return a cached get_profile_contact_info() result without calling the API (None on a miss)."""
+        return self._contact_cache.get(self.lookup_key(public_id, urn_id))
+    
+    def cached_connections(
+        self,
+        urn_id: Optional[str] = None,
+        limit: int = -1
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return a cached get_connections() result without calling the API.
+        
+        Args:
+            urn_id: Profile URN ID (defaults to own profile)
+            limit: Maximum connections to return (-1 for all)
+            
+        Returns:
+            List of connection profiles, or None if the cache can't serve this limit
+        """
+        if not urn_id:
+            urn_id = self.get_my_urn()
+            if not urn_id:
+                return None
+        
+        # Cached as (connections, is_complete); a complete list or a long
+        # enough partial one can serve any smaller limit
+        cached = self._conn_cache.get(urn_id)
+        if cached is not None:
+            connections, is_complete = cached
+            if is_complete or 0 <= limit <= len(connections):
+                return connections if limit < 0 else connections[:limit]
+        return None
+    
+    def clear_caches(self) -> int:
+        """
+        Drop all cached profile, contact info and connection lookups.
+        
+        Returns:
+            Number of cached lookups removed
+        """
+        count = len(self._profile_cache) + len(self._contact_cache) + len(self._conn_cache)
+        self._profile_cache.clear()
+        self._contact_cache.clear()
+        self._conn_cache.clear()
+        return count
+    
+    def get_profiles_bulk(
+        self,
+        ids: List[str],
+        concurrency: int = 3,
+        by: str = "public_id"
+    ) -> Dict[str, Any]:
+        """
+        Fetch several profiles concurrently.
+        
+        Lookups go through get_profile (and its cache), so the library's
+        per-request delays overlap across worker threads. Throttled
+        requests are retried with jittered exponential backoff.
+        
+        Args:
+            ids: Profile identifiers to fetch
+            concurrency: Number of lookups in flight at once
+            by: Identifier type, "public_id" or "urn_id"
+            
+        Returns:
+            Dict mapping each id to its profile dict, or to the exception
+            raised while fetching it
+        """
+        if by not in ("public_id", "urn_id"):
+            raise ValueError("by must be 'public_id' or 'urn_id'")
+        
+        def fetch(profile_id: str) -> Dict[str, Any]:
+            for attempt in range(_BULK_MAX_RETRIES + 1):
+                try:
+                    return self.get_profile(**{by: profile_id})
+                except LinkedInRateLimitError:
+                    if attempt == _BULK_MAX_RETRIES:
+                        raise
+                    delay = _BULK_BACKOFF_SECONDS * (2 ** attempt)
+                    delay += random.uniform(0, delay)
+                    logger.info("Rate limited fetching %s, retrying in %.1fs", profile_id, delay)
+                    time.sleep(delay)
+        
+        results: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(fetch, profile_id): profile_id for profile_id in ids}
+            for future in as_completed(futures):
+                profile_id = futures[future]
+                try:
+                    results[profile_id] = future.result()
+                except Exception as e:
+                    results[profile_id] = e
+        
+        return results
     
     def get_my_profile(self) -> Dict[str, Any]:
         """
@@ -146,7 +535,7 @@ class LinkedInClient:
         Returns:
             Own profile data (normalized structure)
         """
-        if self._my_profile is None:
+        if not self._has_valid_cached_profile():
             raw_profile = self._client.get_user_profile()
             # Normalize the profile structure
             # get_user_profile() returns a different format than get_profile()
@@ -163,8 +552,35 @@ class LinkedInClient:
                 if "occupation" in mini and "headline" not in self._my_profile:
                     self._my_profile["headline"] = mini["occupation"]
             
+            self._my_urn = self._extract_urn(self._my_profile)
+            if self._auth_key:
+                _save_profile_cache(self._auth_key, {
+                    "profile": self._my_profile,
+                    "urn": self._my_urn,
+                })
+            
         return self._my_profile
     
+    def _has_valid_cached_profile(self) -> bool:
+        """
+        Check for an own profile in memory or a fresh one in the disk cache.
+        
+        A disk hit is loaded into memory, so a following get_my_profile()
+        makes no API call.
+        """
+        if self._my_profile is not None:
+            return True
+        if not self._auth_key:
+            return False
+        
+        cached = _load_profile_cache(self._auth_key)
+        if not cached or not cached.get("profile"):
+            return False
+        
+        self._my_profile = cached["profile"]
+        self._my_urn = cached.get("urn")
+        return True
+    
     def get_my_urn(self) -> Optional[str]:
         """
         Get the authenticated user's URN ID.
@@ -172,8 +588,13 @@ class LinkedInClient:
         Returns:
             URN ID string or None
         """
-        profile = self.get_my_profile()
-        
+        if self._my_urn is None:
+            self._my_urn = self._extract_urn(self.get_my_profile())
+        return self._my_urn
+    
+    @staticmethod
+    def _extract_urn(profile: Dict[str, Any]) -> Optional[str]:
+        """Extract the URN ID from a (normalized) own profile."""
         # Try different places where URN might be
         urn = profile.get("entityUrn") or profile.get("urn_id")
         if not urn and "miniProfile" in profile:
@@ -181,12 +602,66 @@ class LinkedInClient:
         
         # Extract just the ID part if it's a full URN
         if urn and ":" in urn:
-            urn = urn.split(":")[-1]
+            urn = urn.rpartition(":")[2]
         
         return urn
     
     # ============ Connection Operations ============
     
+    def iter_connections(
+        self,
+        urn_id: Optional[str] = None,
+        limit: int = -1,
+        page_size: int = 40
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over connections for a profile, one result page at a time.
+        
+        Results are yielded as each page arrives, so callers can start
+        processing before the whole network has been fetched.
+        
+        Args:
+            urn_id: Profile URN ID (defaults to own profile)
+            limit: Maximum connections to yield (-1 for all)
+            page_size: Number of connections requested per page
+            
+        Yields:
+            Connection profiles
+        """
+        # If no URN provided, get the authenticated user's URN
+        if not urn_id:
+            urn_id = self.get_my_urn()
+            if not urn_id:
+                raise ValueError("Could not determine your profile URN. Please provide urn_id explicitly.")
+        
+        # LinkedIn can return short pages (and repeat people across pages)
+        # before the end, so only an empty page stops the walk and the offset
+        # moves by what was asked for, not by what came back
+        seen = set()
+        found = 0
+        offset = 0
+        while limit < 0 or found < limit:
+            count = page_size if limit < 0 else min(page_size, limit - found)
+            page = self._client.search_people(
+                connection_of=urn_id,
+                network_depths=["F"],
+                limit=count,
+                offset=offset,
+            )
+            if not page:
+                break
+            offset += count
+            for person in page:
+                urn = person.get("urn_id")
+                if urn:
+                    if urn in seen:
+                        continue
+                    seen.add(urn)
+                yield person
+                found += 1
+                if found == limit:
+                    return
+    
     def get_connections(
         self,
         urn_id: Optional[str] = None,
@@ -208,7 +683,14 @@ class LinkedInClient:
             if not urn_id:
                 raise ValueError("Could not determine your profile URN. Please provide urn_id explicitly.")
         
-        return self._client.get_profile_connections(urn_id=urn_id)
+        cached = self.cached_connections(urn_id, limit)
+        if cached is not None:
+            return cached
+        
+        connections = list(self.iter_connections(urn_id=urn_id, limit=limit))
+        is_complete = limit < 0 or len(connections) < limit
+        self._conn_cache.set(urn_id, (connections, is_complete))
+        return connections
     
     # ============ Search Operations ============
     
@@ -247,6 +729,52 @@ class LinkedInClient:
             limit=limit
         )
     
+    def iter_search_people(
+        self,
+        keywords: Optional[str] = None,
+        network_depths: Optional[List[str]] = None,
+        limit: int = 10,
+        page_size: int = 49
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Search for people on LinkedIn, yielding results one page at a time.
+        
+        Args:
+            keywords: Search keywords
+            network_depths: List of network depths ("F" = 1st, "S" = 2nd, "O" = 3rd+)
+            limit: Maximum results to yield
+            page_size: Results requested per page (49 is the API maximum)
+            
+        Yields:
+            Matching profiles
+        """
+        # Same paging rules as iter_connections: short pages and repeats
+        # can come before the end, so stop only on an empty page
+        seen = set()
+        found = 0
+        offset = 0
+        while found < limit:
+            count = min(page_size, limit - found)
+            page = self._client.search_people(
+                keywords=keywords,
+                network_depths=network_depths,
+                limit=count,
+                offset=offset,
+            )
+            if not page:
+                break
+            offset += count
+            for person in page:
+                urn = person.get("urn_id")
+                if urn:
+                    if urn in seen:
+                        continue
+                    seen.add(urn)
+                yield person
+                found += 1
+                if found == limit:
+                    return
+    
     # ============ Messaging Operations ============
     
     def get_conversations(self) -> List[Dict[str, Any]]:
@@ -310,52 +838,31 @@ class LinkedInClient:
         Raises:
             LinkedInMessageError: If the message fails to send
         """
-        _ensure_imports()
-        
         if not conversation_urn_id and not recipients:
             raise LinkedInMessageError("Must provide conversation_urn_id or recipients")
         
         params = {"action": "create"}
         
-        message_event = {
-            "eventCreate": {
-                "originToken": str(uuid.uuid4()),
-                "value": {
-                    "com.linkedin.voyager.messaging.create.MessageCreate": {
-                        "attributedBody": {
-                            "text": message_body,
-                            "attributes": [],
-                        },
-                        "attachments": [],
-                    }
-                },
-                "trackingId": generate_trackingId_as_charString(),
-            },
-            "dedupeByClientGeneratedToken": False,
-        }
-        
         if conversation_urn_id and not recipients:
             res = self._client._post(
                 f"/messaging/conversations/{conversation_urn_id}/events",
                 params=params,
-                data=json.dumps(message_event),
+                data=_render_message_payload(_MESSAGE_EVENT_TEMPLATE, message_body),
             )
         elif recipients and not conversation_urn_id:
-            message_event["recipients"] = recipients
-            message_event["subtype"] = "MEMBER_TO_MEMBER"
-            payload = {
-                "keyVersion": "LEGACY_INBOX",
-                "conversationCreate": message_event,
-            }
             res = self._client._post(
                 f"/messaging/conversations",
                 params=params,
-                data=json.dumps(payload),
+                data=_render_message_payload(
+                    _CONVERSATION_CREATE_TEMPLATE, message_body, recipients
+                ),
             )
         else:
             raise LinkedInMessageError("Provide either conversation_urn_id OR recipients, not both")
         
         if res.status_code != 201:
+            if res.status_code in (401, 403):
+                _invalidate_session()
             error_message = f"LinkedIn API error (Status {res.status_code})"
             try:
                 error_detail = res.json()
@@ -367,14 +874,53 @@ class LinkedInClient:
         return True
 
 
-def _load_cookies_from_browsers() -> Optional[RequestsCookieJar]:
+def _probe_browser_cookies(browser_method) -> "Optional[RequestsCookieJar]":
+    """
+    Load LinkedIn cookies from a single browser.
+    
+    Returns:
+        RequestsCookieJar holding just li_at and JSESSIONID if both are
+        present, None otherwise
+    """
+    try:
+        cj = browser_method(domain_name='linkedin.com')
+        
+        # Single pass: pick out the two cookies we need into a small jar
+        li_at = jsessionid = None
+        for cookie in cj:
+            name = cookie.name
+            if name == "li_at":
+                li_at = cookie
+            elif name.lower() == "jsessionid":
+                jsessionid = cookie
+            if li_at is not None and jsessionid is not None:
+                cookie_jar = RequestsCookieJar()
+                cookie_jar.set_cookie(li_at)
+                cookie_jar.set_cookie(jsessionid)
+                return cookie_jar
+        logger.debug("Missing cookies in %s", browser_method.__name__)
+    except Exception as e:
+        logger.debug("Failed to load cookies from %s: %s", browser_method.__name__, e)
+    return None
+
+
+def _load_cookies_from_browsers() -> "Optional[RequestsCookieJar]":
     """
     Try to load LinkedIn cookies from various browsers.
     
+    Browsers are probed in parallel since each one opens (and may decrypt)
+    its own cookie database. If several finish with valid cookies at the
+    same time, the earlier browser in the list wins.
+    
+    Only li_at and JSESSIONID are copied out of the browser's jar, which
+    keeps the Cookie header requests builds for every API call small.
+    
     Returns:
-        RequestsCookieJar if successful, None otherwise
+        RequestsCookieJar with just li_at and JSESSIONID if successful,
+        None otherwise
     """
     _ensure_imports()
+    _ensure_browser_cookie3()
     
     if browser_cookie3 is None:
         return None
@@ -386,25 +932,98 @@ def _load_cookies_from_browsers() -> Optional[RequestsCookieJar]:
         browser_cookie3.edge,
     ]
     
-    for browser_method in browser_methods:
-        try:
-            cj = browser_method(domain_name='linkedin.com')
-            
-            has_li_at = any(cookie.name == "li_at" for cookie in cj)
-            has_jsessionid = any(cookie.name.lower() == "jsessionid" for cookie in cj)
-            
-            if has_li_at and has_jsessionid:
-                logger.info(f"Loaded LinkedIn cookies from {browser_method.__name__}")
-                return cj
-            else:
-                logger.debug(f"Missing cookies in {browser_method.__name__}")
-        except Exception as e:
-            logger.debug(f"Failed to load cookies from {browser_method.__name__}: {e}")
+    executor = ThreadPoolExecutor(max_workers=len(browser_methods))
+    futures = {
+        executor.submit(_probe_browser_cookies, method): index
+        for index, method in enumerate(browser_methods)
+    }
+    try:
+        for future in as_completed(futures):
+            if future.result() is None:
+                continue
+            # Break ties between browsers that finished together by list order
+            index, cj = min(
+                (futures[f], f.result())
+                for f in futures
+                if f.done() and f.result() is not None
+            )
+            logger.info("Loaded LinkedIn cookies from %s", browser_methods[index].__name__)
+            return cj
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
     return None
 
 
-def _load_cookies_from_env() -> Optional[RequestsCookieJar]:
+def _cookie_value(cookies, name: str) -> Optional[str]:
+    """Get a cookie value by (case-insensitive) name from any cookie jar."""
+    name = name.lower()
+    return next((cookie.value for cookie in cookies if cookie.name.lower() == name), None)
+
+
+def _build_cookie_jar(li_at: str, jsession: str) -> "RequestsCookieJar":
+    """Build a LinkedIn cookie jar from li_at and JSESSIONID values."""
+    _ensure_imports()
+    
+    cookie_jar = RequestsCookieJar()
+    cookie_jar.set("li_at", li_at, domain=".linkedin.com", path="/")
+    cookie_jar.set("JSESSIONID", jsession, domain=".linkedin.com", path="/")
+    return cookie_jar
+
+
+def _load_cached_browser_cookies() -> "Optional[RequestsCookieJar]":
+    """
+    Load previously extracted browser cookies if still fresh.
+    
+    Checks the in-memory cache first, then the on-disk cache.
+    
+    Returns:
+        RequestsCookieJar if a fresh entry exists, None otherwise
+    """
+    now = time.time()
+    if _cookie_cache["jar"] is not None and _cookie_cache["expires"] > now:
+        return _cookie_cache["jar"]
+    
+    try:
+        with open(_COOKIE_CACHE_PATH, 'r') as f:
+            entry = json.load(f)
+        if entry["expires"] <= now:
+            return None
+        cookie_jar = _build_cookie_jar(entry["li_at"], entry["jsessionid"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    _cookie_cache["jar"] = cookie_jar
+    _cookie_cache["expires"] = entry["expires"]
+    logger.info("Loaded LinkedIn cookies from cache")
+    return cookie_jar
+
+
+def _save_browser_cookie_cache(cookies, ttl: int = _COOKIE_CACHE_TTL):
+    """Cache extracted browser cookies in memory and on disk (mode 0600)."""
+    li_at = _cookie_value(cookies, "li_at")
+    jsession = _cookie_value(cookies, "JSESSIONID")
+    if not li_at or not jsession:
+        return
+    
+    expires = time.time() + ttl
+    _cookie_cache["jar"] = cookies
+    _cookie_cache["expires"] = expires
+    
+    _write_private_json(
+        _COOKIE_CACHE_PATH,
+        {"li_at": li_at, "jsessionid": jsession, "expires": expires}
+    )
+
+
+def _clear_cookie_cache():
+    """Drop cached browser cookies from memory and disk."""
+    _cookie_cache["jar"] = None
+    _cookie_cache["expires"] = 0
+    _remove_cache_file(_COOKIE_CACHE_PATH)
+
+
+def _load_cookies_from_env() -> "Optional[RequestsCookieJar]":
     """
     Load LinkedIn cookies from environment variables.
     
@@ -415,54 +1034,47 @@ def _load_cookies_from_env() -> Optional[RequestsCookieJar]:
     Returns:
         RequestsCookieJar if successful, None otherwise
     """
-    li_at = os.getenv("LINKEDIN_LI_AT")
-    jsession = os.getenv("LINKEDIN_JSESSIONID")
+    env = _get_env()
+    li_at = env["LI_AT"]
+    jsession = env["JSESSIONID"]
     
     if not li_at or not jsession:
         return None
     
+    li_at, jsession = _normalize_env_cookies(li_at, jsession)
+    return _build_cookie_jar(li_at, jsession)
+
+
+@lru_cache(maxsize=1)
+def _normalize_env_cookies(li_at: str, jsession_raw: str) -> Tuple[str, str]:
+    """
+    Clean up raw env cookie values (memoized on the raw strings).
+    
+    Returns:
+        Tuple of (li_at, jsessionid) ready to put in a cookie jar
+    """
     # Clean up li_at - remove any surrounding quotes
     li_at = li_at.strip().strip('"').strip("'")
     
     # JSESSIONID must have quotes around it for LinkedIn API
     # Format should be: "ajax:1234567890123456789"
-    jsession = jsession.strip()
-    
-    # Remove outer quotes if present (env files can add extra escaping)
-    if (jsession.startswith('"\\"') and jsession.endswith('\\""')) or \
-       (jsession.startswith("'\\\"") and jsession.endswith("\\\"'")):
-        # Handle escaped quotes: "\"ajax:...\"" -> "ajax:..."
-        jsession = jsession[2:-2]
-    elif (jsession.startswith('"') and jsession.endswith('"') and jsession.count('"') == 2):
-        # Already properly quoted: "ajax:..." -> keep as is
-        pass
-    elif jsession.startswith("'") and jsession.endswith("'"):
-        # Single quoted in env: 'ajax:...' or '"ajax:..."'
-        jsession = jsession[1:-1]
-    
-    # Now ensure it has the required quotes
-    if not jsession.startswith('"'):
-        jsession = '"' + jsession
-    if not jsession.endswith('"'):
-        jsession = jsession + '"'
+    # Env files may add single quotes or escaped quotes; strip them all, then re-wrap once
+    payload = _JSESSION_RE.match(jsession_raw.strip()).group(1)
+    jsession = f'"{payload}"'
     
     # Validate cookie formats
     if not li_at.startswith("AQ"):
-        logger.warning(f"li_at cookie doesn't start with 'AQ' - may be invalid")
+        logger.warning("li_at cookie doesn't start with 'AQ' - may be invalid")
     
     if not jsession.startswith('"ajax:'):
-        logger.warning(f"JSESSIONID doesn't start with '\"ajax:' - may be invalid. Got: {jsession[:20]}...")
+        logger.warning("JSESSIONID doesn't start with '\"ajax:' - may be invalid. Got: %s...", jsession[:20])
     
-    logger.info(f"Loading cookies from env - li_at: {li_at[:10]}..., JSESSIONID: {jsession[:15]}...")
+    logger.info("Loading cookies from env - li_at: %s..., JSESSIONID: %s...", li_at[:10], jsession[:15])
     
-    cookie_jar = RequestsCookieJar()
-    cookie_jar.set("li_at", li_at, domain=".linkedin.com", path="/")
-    cookie_jar.set("JSESSIONID", jsession, domain=".linkedin.com", path="/")
-    
-    return cookie_jar
+    return li_at, jsession
 
 
-def _create_client_with_cookies(cookies: RequestsCookieJar) -> LinkedInClient:
+def _create_client_with_cookies(cookies: "RequestsCookieJar") -> LinkedInClient:
     """Create a LinkedIn client using cookies."""
     _ensure_imports()
     
@@ -471,7 +1083,8 @@ def _create_client_with_cookies(cookies: RequestsCookieJar) -> LinkedInClient:
         password="",
         cookies=cookies
     )
-    return LinkedInClient(client)
+    li_at = _cookie_value(cookies, "li_at")
+    return LinkedInClient(client, auth_key=_auth_key_for(li_at) if li_at else None)
 
 
 def _create_client_with_credentials(email: str, password: str) -> LinkedInClient:
@@ -483,12 +1096,85 @@ def _create_client_with_credentials(email: str, password: str) -> LinkedInClient
         password,
         refresh_cookies=True
     )
-    return LinkedInClient(client)
+    return LinkedInClient(client, auth_key=_auth_key_for(email))
+
+
+def _persist_client(client: LinkedInClient):
+    """
+    Save the client's session cookies so the next process can reuse them.
+    
+    The CSRF token is derived from JSESSIONID by linkedin-api, so the
+    cookies are all that's needed to restore the session.
+    """
+    try:
+        session_cookies = client._client.client.session.cookies
+    except AttributeError:
+        return
+    
+    cookies = [
+        {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+        for c in session_cookies
+    ]
+    if cookies:
+        _write_private_json(_SESSION_CACHE_PATH, {"cookies": cookies})
+
+
+def _restore_client() -> Optional[LinkedInClient]:
+    """
+    Rebuild a client from a session saved by _persist_client.
+    
+    Returns:
+        LinkedInClient, or None if no usable session was saved
+    """
+    try:
+        with open(_SESSION_CACHE_PATH, 'r') as f:
+            cookies = json.load(f)["cookies"]
+        cookie_jar = RequestsCookieJar()
+        for c in cookies:
+            cookie_jar.set(c["name"], c["value"], domain=c["domain"], path=c["path"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    
+    if not _cookie_value(cookie_jar, "li_at") or not _cookie_value(cookie_jar, "JSESSIONID"):
+        return None
+    return _create_client_with_cookies(cookie_jar)
+
+
+def _clear_session_cache():
+    """Delete the saved session."""
+    _remove_cache_file(_SESSION_CACHE_PATH)
 
 
-# Singleton instance
+def _invalidate_session():
+    """
+    Forget the current session after LinkedIn rejects it (401/403).
+    
+    Drops the saved session, the cached browser cookies, and the client
+    singleton, so the next get_linkedin_client() call authenticates again
+    instead of reusing dead cookies. Doesn't take _init_lock, since it can
+    run while a client is being verified under it.
+    """
+    global _linkedin_client
+    _clear_session_cache()
+    _clear_cookie_cache()
+    _linkedin_client = None
+
+
+def _verify_client(client: LinkedInClient):
+    """
+    Test a cookie-authenticated client with one profile fetch.
+    
+    Skipped when a fresh cached profile exists for the same session; the
+    fetch otherwise populates that cache for later get_my_profile() calls.
+    """
+    if not client._has_valid_cached_profile():
+        client.get_my_profile()
+
+
+# Singleton instance (initialization guarded by _init_lock)
 _linkedin_client: Optional[LinkedInClient] = None
 _linkedin_error: Optional[str] = None
+_init_lock = threading.Lock()
 
 
 def get_linkedin_client(
@@ -498,10 +1184,14 @@ def get_linkedin_client(
     """
     Get or create the LinkedIn client singleton.
     
-    Authentication is attempted in this order:
-    1. Username/password (if provided or in env)
-    2. Browser cookies (Brave, Chrome, Firefox, Edge)
-    3. Environment variable cookies (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID)
+    Authentication is attempted cheapest-first:
+    1. Environment variable cookies (LINKEDIN_LI_AT, LINKEDIN_JSESSIONID)
+    2. Session saved by a previous run - skipped when env cookies are set
+    3. Browser cookies (Brave, Chrome, Firefox, Edge) - skipped when env
+       cookies are set
+    4. Username/password (if provided or in env)
+    
+    Browser and username/password sessions are saved for the next run.
     
     Args:
         email: LinkedIn email (optional, falls back to LINKEDIN_EMAIL env)
@@ -510,54 +1200,90 @@ def get_linkedin_client(
     Returns:
         Tuple of (client, error_message). One will be None.
     """
-    global _linkedin_client, _linkedin_error
-    
+    # Fast path without taking the lock
     if _linkedin_client is not None:
         return _linkedin_client, None
     
     if _linkedin_error is not None:
         return None, _linkedin_error
     
+    with _init_lock:
+        # Another thread may have finished initializing while we waited
+        if _linkedin_client is not None:
+            return _linkedin_client, None
+        
+        if _linkedin_error is not None:
+            return None, _linkedin_error
+        
+        return _init_linkedin_client(email, password)
+
+
+def _init_linkedin_client(
+    email: Optional[str],
+    password: Optional[str]
+) -> Tuple[Optional[LinkedInClient], Optional[str]]:
+    """Authenticate and set the singleton (caller must hold _init_lock)."""
+    global _linkedin_client, _linkedin_error
+    
     _ensure_imports()
     
+    # Try environment variable cookies first (no I/O needed)
+    cookies = _load_cookies_from_env()
+    if cookies:
+        try:
+            client = _create_client_with_cookies(cookies)
+            _verify_client(client)
+            logger.info("LinkedIn login successful with environment cookies")
+            _linkedin_client = client
+            return _linkedin_client, None
+        except Exception as e:
+            logger.warning("Environment cookie login failed: %s", e)
+    else:
+        # Try the session saved by a previous process
+        client = _restore_client()
+        if client is not None:
+            try:
+                _verify_client(client)
+                logger.info("LinkedIn login successful with saved session")
+                _linkedin_client = client
+                return _linkedin_client, None
+            except Exception as e:
+                logger.warning("Saved session login failed: %s", e)
+                _clear_session_cache()
+        
+        # Try browser cookies (reusing a recent extraction when available)
+        cookies = _load_cached_browser_cookies()
+        if cookies is None:
+            cookies = _load_cookies_from_browsers()
+            if cookies:
+                _save_browser_cookie_cache(cookies)
+        if cookies:
+            try:
+                client = _create_client_with_cookies(cookies)
+                _verify_client(client)
+                logger.info("LinkedIn login successful with browser cookies")
+                _persist_client(client)
+                _linkedin_client = client
+                return _linkedin_client, None
+            except Exception as e:
+                logger.warning("Browser cookie login failed: %s", e)
+                _clear_cookie_cache()
+    
     # Get credentials from parameters or environment
-    email = email or os.getenv("LINKEDIN_EMAIL")
-    password = password or os.getenv("LINKEDIN_PASSWORD")
+    env = _get_env()
+    email = email or env["EMAIL"]
+    password = password or env["PASSWORD"]
     
-    # Try username/password login first
+    # Try username/password login last (slowest, may hit 2FA/challenge)
     if email and password:
         try:
             logger.info("Attempting LinkedIn login with username/password...")
             _linkedin_client = _create_client_with_credentials(email, password)
             logger.info("LinkedIn login successful with username/password")
+            _persist_client(_linkedin_client)
             return _linkedin_client, None
         except Exception as e:
-            logger.warning(f"Username/password login failed: {e}")
-            # Fall through to try cookies
-    
-    # Try browser cookies
-    cookies = _load_cookies_from_browsers()
-    if cookies:
-        try:
-            _linkedin_client = _create_client_with_cookies(cookies)
-            # Test the connection
-            _linkedin_client.get_my_profile()
-            logger.info("LinkedIn login successful with browser cookies")
-            return _linkedin_client, None
-        except Exception as e:
-            logger.warning(f"Browser cookie login failed: {e}")
-    
-    # Try environment variable cookies
-    cookies = _load_cookies_from_env()
-    if cookies:
-        try:
-            _linkedin_client = _create_client_with_cookies(cookies)
-            # Test the connection
-            _linkedin_client.get_my_profile()
-            logger.info("LinkedIn login successful with environment cookies")
-            return _linkedin_client, None
-        except Exception as e:
-            logger.warning(f"Environment cookie login failed: {e}")
+            logger.warning("Username/password login failed: %s", e)
     
     # All methods failed
     _linkedin_error = (
@@ -583,9 +1309,27 @@ def get_linkedin_client(
     return None, _linkedin_error
 
 
+def clear_linkedin_caches() -> int:
+    """
+    Clear the active client's lookup caches without triggering authentication.
+    
+    Returns:
+        Number of cached lookups removed
+    """
+    client = _linkedin_client
+    if client is None:
+        return 0
+    return client.clear_caches()
+
+
 def reset_linkedin_client():
     """Reset the singleton client (useful for re-authentication)."""
     global _linkedin_client, _linkedin_error
-    _linkedin_client = None
-    _linkedin_error = None
+    with _init_lock:
+        _linkedin_client = None
+        _linkedin_error = None
+        _clear_profile_cache()
+        _clear_cookie_cache()
+        _clear_session_cache()
+        refresh_env()
 
@@ -22,17 +22,19 @@ Usage:
     uvicorn server:app --host 127.0.0.1 --port 8765 --reload
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, Header, Path
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from config import config
-from toolsets import get_toolset, get_all_toolset_names, get_enabled_toolsets
-from toolsets.base import tools_to_mcp_format, get_tool
+from toolsets import get_toolset, get_all_toolset_names, get_enabled_toolsets, is_concurrent_toolset
+from toolsets.base import RegisteredTool, tools_to_mcp_format, get_tool
 
 
 # ============ Logging Setup ============
@@ -138,6 +140,34 @@ def validate_toolset(toolset: str) -> List:
     return tools
 
 
+# ============ Tool Execution ============
+
+# Toolsets not registered as concurrent run one call at a time
+_toolset_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def run_tool(toolset: str, tool: RegisteredTool, arguments: Dict[str, Any]) -> str:
+    """
+    Run a tool in the worker threadpool so slow API calls don't block the event loop.
+
+    Args:
+        toolset: Name of the toolset the tool belongs to
+        tool: The tool to execute
+        arguments: Keyword arguments for the tool
+
+    Returns:
+        The tool's result
+    """
+    if is_concurrent_toolset(toolset):
+        return await run_in_threadpool(tool.execute, **arguments)
+
+    lock = _toolset_locks.get(toolset)
+    if lock is None:
+        lock = _toolset_locks[toolset] = asyncio.Lock()
+    async with lock:
+        return await run_in_threadpool(tool.execute, **arguments)
+
+
 # ============ Application Lifecycle ============
 
 @asynccontextmanager
@@ -277,7 +307,7 @@ async def execute_toolset_tool(
         )
     
     try:
-        result = tool.execute(**request.arguments)
+        result = await run_tool(toolset, tool, request.arguments)
         logger.info(f"[{toolset}] Tool {request.name} completed successfully")
         logger.debug(f"Result: {result[:200]}..." if len(result) > 200 else f"Result: {result}")
         
@@ -335,12 +365,15 @@ async def legacy_execute(
         raise HTTPException(status_code=404, detail=f"Tool not found: {request.name}")
     
     # Check if tool is in an enabled toolset
-    enabled_tools = get_enabled_toolsets(config.ENABLED_TOOLSETS)
-    if tool not in enabled_tools:
+    toolset = next(
+        (name for name in config.ENABLED_TOOLSETS if tool in get_toolset(name)),
+        None
+    )
+    if toolset is None:
         raise HTTPException(status_code=403, detail=f"Tool not enabled: {request.name}")
     
     try:
-        result = tool.execute(**request.arguments)
+        result = await run_tool(toolset, tool, request.arguments)
         return ToolExecuteResponse(result=result)
     except Exception as e:
         return ToolExecuteResponse(error=str(e))
@@ -11,6 +11,7 @@ Usage:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -29,13 +30,19 @@ def print_header(title: str):
     print("=" * 60)
 
 
+_OK = "✅ "
+_BAD = "❌ "
+
+
 def print_status(label: str, status: bool, details: str = ""):
     """Print a status line."""
-    icon = "✅" if status else "❌"
-    line = f"{icon} {label}"
+    write = sys.stdout.write
+    write(_OK if status else _BAD)
+    write(label)
     if details:
-        line += f": {details}"
-    print(line)
+        write(": ")
+        write(details)
+    write("\n")
 
 
 def check_env_vars():
@@ -105,6 +112,29 @@ def check_env_vars():
     return has_credentials or has_cookies
 
 
+def scan_browser(browser_func):
+    """
+    Look for LinkedIn cookies in one browser.
+    
+    Returns:
+        Tuple of (has_li_at, has_jsession, error)
+    """
+    has_li_at = has_jsession = False
+    try:
+        cj = browser_func(domain_name='linkedin.com')
+        for c in cj:
+            cookie_name = c.name
+            if cookie_name == "li_at":
+                has_li_at = True
+            elif cookie_name.lower() == "jsessionid":
+                has_jsession = True
+            if has_li_at and has_jsession:
+                break
+    except Exception as e:
+        return False, False, e
+    return has_li_at, has_jsession, None
+
+
 def check_browser_cookies():
     """Check if we can extract cookies from browsers."""
     print_header("Browser Cookie Check")
@@ -123,26 +153,26 @@ def check_browser_cookies():
         ("Edge", browser_cookie3.edge),
     ]
     
+    # Scan all browsers in parallel, then report in the order listed above
+    with ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+        futures = [executor.submit(scan_browser, browser_func) for _, browser_func in browsers]
+        results = [future.result() for future in futures]
+    
     found_cookies = False
     
-    for name, browser_func in browsers:
-        try:
-            cj = browser_func(domain_name='linkedin.com')
-            has_li_at = any(c.name == "li_at" for c in cj)
-            has_jsession = any(c.name.lower() == "jsessionid" for c in cj)
-            
-            if has_li_at and has_jsession:
-                print_status(name, True, "LinkedIn cookies found!")
-                found_cookies = True
-            elif has_li_at or has_jsession:
-                print_status(name, False, f"Partial cookies (li_at={has_li_at}, JSESSIONID={has_jsession})")
-            else:
-                print_status(name, False, "No LinkedIn cookies")
-        except Exception as e:
-            error_msg = str(e)
+    for (name, _), (has_li_at, has_jsession, error) in zip(browsers, results):
+        if error is not None:
+            error_msg = str(error)
             if len(error_msg) > 50:
                 error_msg = error_msg[:50] + "..."
             print_status(name, False, f"Error: {error_msg}")
+        elif has_li_at and has_jsession:
+            print_status(name, True, "LinkedIn cookies found!")
+            found_cookies = True
+        elif has_li_at or has_jsession:
+            print_status(name, False, f"Partial cookies (li_at={has_li_at}, JSESSIONID={has_jsession})")
+        else:
+            print_status(name, False, "No LinkedIn cookies")
     
     return found_cookies
 
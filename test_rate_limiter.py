@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter Persistence Tests
+
+Checks that RateLimiter's rolling 24-hour window survives restarts,
+including the first start on a new day.
+
+Usage:
+    python test_rate_limiter.py
+    (or: python -m pytest test_rate_limiter.py)
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.rate_limiter import RateLimiter
+
+
+def _write_state(storage_dir: Path, name: str, day: date, timestamps: list):
+    """Write a state file as a previous run would have left it."""
+    data = {
+        "date": day.toordinal(),
+        "operations_count": len(timestamps),
+        "last_operation_time": max(timestamps),
+        "recent_operations": timestamps,
+    }
+    with open(storage_dir / f"{name}_rate_limit.json", "w") as f:
+        json.dump(data, f)
+
+
+def test_window_survives_restart_on_new_day():
+    """Operations from late yesterday still count after two restarts today."""
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_dir = Path(tmp)
+        an_hour_ago = time.time() - 3600
+        _write_state(storage_dir, "t", date.today() - timedelta(days=1), [an_hour_ago] * 3)
+
+        limiter = RateLimiter("t", 0, 0, max_per_day=5, storage_dir=storage_dir)
+        assert limiter.get_remaining_today() == 2
+        assert limiter.get_operations_today() == 0
+        limiter.close()
+
+        limiter = RateLimiter("t", 0, 0, max_per_day=5, storage_dir=storage_dir)
+        assert limiter.get_remaining_today() == 2
+        limiter.close()
+
+
+def test_recorded_operations_survive_restart():
+    """Operations recorded but not yet flushed are replayed from the ops log."""
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_dir = Path(tmp)
+        limiter = RateLimiter("t", 0, 0, max_per_day=5, flush_interval=60, storage_dir=storage_dir)
+        for _ in range(2):
+            assert limiter.wait()
+            limiter.record_success()
+        # Simulate a crash: no flush, just drop the log handle
+        limiter._log_fh.close()
+        limiter._log_fh = None
+        limiter._flush_due = None
+        limiter._dirty = False
+
+        limiter = RateLimiter("t", 0, 0, max_per_day=5, storage_dir=storage_dir)
+        assert limiter.get_remaining_today() == 3
+        assert limiter.get_operations_today() == 2
+        limiter.close()
+
+
+def main():
+    failed = 0
+    for test in (test_window_survives_restart_on_new_day, test_recorded_operations_survive_restart):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
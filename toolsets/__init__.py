@@ -4,7 +4,7 @@ Toolsets Module
 This module provides the toolset registry and imports all available toolsets.
 """
 
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, List, Sequence, Set, TYPE_CHECKING
 import logging
 
 from .base import ToolDefinition, get_all_tools
@@ -15,16 +15,38 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Will be populated by toolset imports
-_toolsets: Dict[str, List["RegisteredTool"]] = {}
-
-
-def register_toolset(name: str, tools: List["RegisteredTool"]) -> None:
-    """Register a toolset with its tools."""
+_toolsets: Dict[str, Sequence["RegisteredTool"]] = {}
+
+# Toolsets whose tools are safe to run concurrently from several threads
+_concurrent_toolsets: Set[str] = set()
+
+
+def register_toolset(
+    name: str,
+    tools: Sequence["RegisteredTool"],
+    concurrent: bool = False
+) -> None:
+    """
+    Register a toolset with its tools.
+    
+    Args:
+        name: Toolset name (used in the /mcp/{toolset} URLs)
+        tools: The toolset's tools
+        concurrent: Whether its tools may run in parallel; otherwise the
+            server runs them one at a time
+    """
     _toolsets[name] = tools
+    if concurrent:
+        _concurrent_toolsets.add(name)
     logger.debug(f"Registered toolset '{name}' with {len(tools)} tools")
 
 
-def get_toolset(name: str) -> List["RegisteredTool"]:
+def is_concurrent_toolset(name: str) -> bool:
+    """Check whether a toolset's tools may run in parallel."""
+    return name in _concurrent_toolsets
+
+
+def get_toolset(name: str) -> Sequence["RegisteredTool"]:
     """Get tools from a specific toolset."""
     return _toolsets.get(name, [])
 
@@ -72,7 +94,8 @@ except ImportError as e:
 # LinkedIn toolset (requires cookies or credentials)
 try:
     from . import linkedin
-    register_toolset("linkedin", linkedin.TOOLS)
+    # Limiters, caches and client setup are lock-protected
+    register_toolset("linkedin", linkedin.TOOLS, concurrent=True)
 except ImportError as e:
     logger.warning(f"LinkedIn toolset not available: {e}")
 
@@ -33,6 +33,8 @@ class ToolDefinition:
 @dataclass
 class RegisteredTool:
     """A tool with its definition and executor function."""
+    __slots__ = ("definition", "execute")
+    
     definition: ToolDefinition
     execute: Callable[..., str]
 
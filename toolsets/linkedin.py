@@ -16,17 +16,21 @@ Rate Limits (default):
 
 import json
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterator, Optional, Tuple, TYPE_CHECKING
 
+import integrations
 from .base import tool, RegisteredTool
-from integrations.linkedin_client import (
-    get_linkedin_client,
-    LinkedInClient,
-    LinkedInMessageError,
-)
+from utils.cache import TTLCache, SingleFlight
 from utils.rate_limiter import RateLimiter
 
+if TYPE_CHECKING:
+    from integrations.linkedin_client import LinkedInClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +43,7 @@ _profile_limiter = RateLimiter(
     max_delay_seconds=30.0,
     max_per_day=500,
     night_mode=False,
+    burst_capacity=5,
 )
 
 _search_limiter = RateLimiter(
@@ -47,6 +52,7 @@ _search_limiter = RateLimiter(
     max_delay_seconds=60.0,
     max_per_day=100,
     night_mode=False,
+    burst_capacity=2,
 )
 
 _message_limiter = RateLimiter(
@@ -55,147 +61,389 @@ _message_limiter = RateLimiter(
     max_delay_seconds=180.0,
     max_per_day=100,
     night_mode=False,
+    burst_capacity=2,
 )
 
 
-def _get_client() -> LinkedInClient:
+# ============ Lookup Caches ============
+# Profiles, contact info and connections are cached by LinkedInClient; its
+# cached_*() methods are checked first so hits skip the rate limiter entirely
+# (no delay, no daily quota used)
+
+# Lookups that failed with a definitive API error (e.g. profile not found),
+# so repeated bad IDs don't each spend a rate-limited request
+_error_cache = TTLCache(maxsize=1024, ttl=300)      # 5 minutes
+
+# Recipient URN ID -> ID of our existing 1:1 conversation with them, learned
+# from conversation listings (which show every participant) so sends can
+# post straight into that thread
+_conversation_ids = TTLCache(maxsize=1024, ttl=3600)  # 1 hour
+
+
+def _get_client() -> "LinkedInClient":
     """Get LinkedIn client or raise error."""
-    client, error = get_linkedin_client()
+    # Resolved lazily so the client module loads on first tool use
+    client, error = integrations.get_linkedin_client()
     if error:
         raise RuntimeError(error)
     return client
 
 
-def _format_profile(profile: Dict[str, Any], verbose: bool = False) -> str:
-    """Format a profile for display."""
-    lines = []
-    
-    # Handle nested miniProfile structure
-    mini = profile.get("miniProfile", {})
-    
-    # Name and headline - try multiple sources
-    first_name = profile.get("firstName") or mini.get("firstName", "")
-    last_name = profile.get("lastName") or mini.get("lastName", "")
-    name = f"{first_name} {last_name}".strip() or "(No name)"
-    headline = profile.get("headline") or profile.get("occupation") or mini.get("occupation", "")
+def _remember_error(key: Tuple[str, Tuple[str, str]], error: Exception):
+    """Negative-cache a lookup failure if it's an API answer rather than a transient error."""
+    if isinstance(error, ValueError) and not isinstance(error, integrations.LinkedInRateLimitError):
+        _error_cache.set(key, str(error))
+
+
+def _raise_if_known_error(key: Tuple[str, Tuple[str, str]]):
+    """Re-raise a recently cached lookup failure without calling the API."""
+    message = _error_cache.get(key)
+    if message is not None:
+        raise ValueError(message)
+
+
+def _member_urn_id(member: Dict[str, Any]) -> str:
+    """Get the profile URN ID of a messaging member (participant or sender)."""
+    mini = member.get("com.linkedin.voyager.messaging.MessagingMember", {}).get("miniProfile", {})
+    return mini.get("entityUrn", "").rpartition(":")[2]
+
+
+def _remember_conversations(conversations: List[Dict[str, Any]]):
+    """Record the conversation ID of each 1:1 conversation by its other participant."""
+    for conv in conversations:
+        # Participants exclude ourselves, so one means a direct thread
+        participants = conv.get("participants", [])
+        if len(participants) != 1:
+            continue
+        urn_id = _member_urn_id(participants[0])
+        conv_id = conv.get("entityUrn", "").rpartition("fs_conversation:")[2]
+        if urn_id and conv_id:
+            _conversation_ids.set(urn_id, conv_id)
+
+
+class _DailyLimitReached(Exception):
+    """Raised by the lookup helpers when the limiter refuses an operation."""
+    pass
+
+
+# Concurrent identical lookups share one rate-limited API call
+_lookups_in_flight = SingleFlight()
+
+# Max profile lookups a batch runs at once
+_BATCH_CONCURRENCY = 4
+
+# Gap before a batch starts; the batch then runs without per-lookup delays
+_BATCH_MIN_INTERVAL = 2.0
+
+
+class _Reservation:
+    """Profile lookups pre-granted by RateLimiter.wait_batch(), handed out one at a time."""
+    
+    def __init__(self, limiter: RateLimiter, granted: int):
+        self._limiter = limiter
+        self._left = granted
+        self._lock = threading.Lock()
+    
+    def take(self) -> bool:
+        """Claim one reserved lookup, or return False if none are left."""
+        with self._lock:
+            if self._left <= 0:
+                return False
+            self._left -= 1
+            return True
+    
+    def release_unused(self):
+        """Return any unclaimed lookups to the limiter."""
+        with self._lock:
+            unused, self._left = self._left, 0
+        if unused:
+            self._limiter.release(unused)
+
+
+def _fetch_profile(
+    key: Tuple[str, str],
+    public_id: str,
+    urn_id: str,
+    reservation: Optional[_Reservation] = None
+) -> Dict[str, Any]:
+    """Fetch a profile through the rate limiter (or a batch reservation)."""
+    granted = reservation.take() if reservation is not None else _profile_limiter.wait()
+    if not granted:
+        raise _DailyLimitReached()
     
-    lines.append(f"**{name}**")
-    if headline:
-        lines.append(f"_{headline}_")
+    try:
+        client = _get_client()
+        profile = client.get_profile(
+            public_id=public_id if public_id else None,
+            urn_id=urn_id if urn_id else None
+        )
+    except Exception as e:
+        _profile_limiter.record_failure()
+        _remember_error(("profile", key), e)
+        raise
     
-    # Identifiers
-    public_id = profile.get("public_id") or profile.get("publicIdentifier", "")
-    urn_id = profile.get("urn_id") or profile.get("entityUrn", "")
-    if urn_id and ":" in urn_id:
-        urn_id = urn_id.split(":")[-1]
+    _profile_limiter.record_success()
+    return profile
+
+
+def _lookup_profile(
+    public_id: str,
+    urn_id: str,
+    reservation: Optional[_Reservation] = None
+) -> Dict[str, Any]:
+    """
+    Get a profile from the cache, or fetch it (coalescing duplicate requests).
+    
+    A reservation from a batch, if given, is used instead of waiting on the
+    profile limiter; cache hits don't consume it.
+    
+    Raises:
+        _DailyLimitReached: If the daily profile limit is exhausted
+        ValueError: If the API rejected the lookup (possibly remembered
+            from a recent identical lookup)
+    """
+    client = _get_client()
+    profile = client.cached_profile(
+        public_id=public_id if public_id else None,
+        urn_id=urn_id if urn_id else None
+    )
+    if profile is not None:
+        return profile
+    key = client.lookup_key(public_id, urn_id)
+    _raise_if_known_error(("profile", key))
+    return _lookups_in_flight.run(
+        ("profile", key),
+        lambda: _fetch_profile(key, public_id, urn_id, reservation)
+    )
+
+
+def _fetch_contact_info(key: Tuple[str, str], public_id: str, urn_id: str) -> Dict[str, Any]:
+    """Fetch contact info through the rate limiter."""
+    if not _profile_limiter.wait():
+        raise _DailyLimitReached()
     
-    if public_id:
-        lines.append(f"Public ID: {public_id}")
-    if urn_id:
-        lines.append(f"URN ID: {urn_id}")
+    try:
+        client = _get_client()
+        info = client.get_profile_contact_info(
+            public_id=public_id if public_id else None,
+            urn_id=urn_id if urn_id else None
+        )
+    except Exception as e:
+        _profile_limiter.record_failure()
+        _remember_error(("contact", key), e)
+        raise
     
-    # Location
-    location = profile.get("locationName") or profile.get("geoLocationName", "")
-    if location:
-        lines.append(f"Location: {location}")
+    _profile_limiter.record_success()
+    return info
+
+
+def _lookup_contact_info(public_id: str, urn_id: str) -> Dict[str, Any]:
+    """
+    Get contact info from the cache, or fetch it (coalescing duplicate requests).
+    
+    Raises:
+        _DailyLimitReached: If the daily profile limit is exhausted
+        ValueError: If the API rejected the lookup (possibly remembered
+            from a recent identical lookup)
+    """
+    client = _get_client()
+    info = client.cached_contact_info(
+        public_id=public_id if public_id else None,
+        urn_id=urn_id if urn_id else None
+    )
+    if info is not None:
+        return info
+    key = client.lookup_key(public_id, urn_id)
+    _raise_if_known_error(("contact", key))
+    return _lookups_in_flight.run(
+        ("contact", key),
+        lambda: _fetch_contact_info(key, public_id, urn_id)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fmt_minute(minute: int) -> str:
+    """Format minutes since the epoch as local 'YYYY-MM-DD HH:MM' ("" if out of range)."""
+    try:
+        t = time.localtime(minute * 60)
+    except (OverflowError, OSError, ValueError):
+        return ""
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+
+
+def _fmt_ms(timestamp_ms: int) -> str:
+    """Format a LinkedIn millisecond timestamp (memoized at minute granularity)."""
+    return _fmt_minute(int(timestamp_ms // 60000)) if timestamp_ms else ""
+
+
+def _pick(key: str, *dicts: Dict[str, Any], default: Any = "") -> Any:
+    """Return the first truthy value for key across dicts, else default."""
+    for d in dicts:
+        value = d.get(key)
+        if value:
+            return value
+    return default
+
+
+def _full_name(*dicts: Dict[str, Any]) -> str:
+    """'First Last' from the first dicts that have each part ("" if none do)."""
+    return f"{_pick('firstName', *dicts)} {_pick('lastName', *dicts)}".strip()
+
+
+class _ProfileView:
+    """The fields of a raw profile that _format_profile displays, resolved once."""
+    __slots__ = (
+        "name", "headline", "public_id", "urn_id", "location", "industry",
+        "current", "summary", "education",
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        headline: str,
+        public_id: str,
+        urn_id: str,
+        location: str,
+        industry: str,
+        current: str,
+        summary: str,
+        education: Optional[Tuple[str, ...]],
+    ):
+        self.name = name
+        self.headline = headline
+        self.public_id = public_id
+        self.urn_id = urn_id
+        self.location = location
+        self.industry = industry
+        self.current = current
+        self.summary = summary
+        self.education = education
+
+
+def _parse_profile(profile: Dict[str, Any]) -> _ProfileView:
+    """Resolve a raw profile's display fields, trying each field's fallback sources."""
+    get = profile.get
     
-    # Industry
-    industry = profile.get("industryName", "")
-    if industry:
-        lines.append(f"Industry: {industry}")
+    # Handle nested miniProfile structure
+    mini = get("miniProfile") or {}
     
     # Current position
-    experience = profile.get("experience", [])
+    current = ""
+    experience = get("experience")
     if experience:
-        current = experience[0]  # Most recent
-        company = current.get("companyName", "")
-        title = current.get("title", "")
+        latest = experience[0]  # Most recent
+        company = latest.get("companyName", "")
+        title = latest.get("title", "")
         if company or title:
-            lines.append(f"Current: {title} at {company}".strip())
-    
-    # Summary (if verbose)
-    if verbose:
-        summary = profile.get("summary", "")
-        if summary:
-            lines.append("")
-            lines.append("**Summary:**")
-            # Truncate long summaries
-            if len(summary) > 500:
-                summary = summary[:500] + "..."
-            lines.append(summary)
-        
-        # Education
-        education = profile.get("education", [])
-        if education:
-            lines.append("")
-            lines.append("**Education:**")
-            for edu in education[:3]:  # Top 3
-                school = edu.get("schoolName", "")
+            current = f"{title} at {company}"
+    
+    # Education (top 3 with a school); None when the profile lists none
+    education = None
+    entries = get("education")
+    if entries:
+        education = []
+        for edu in entries[:3]:
+            school = edu.get("schoolName", "")
+            if school:
                 degree = edu.get("degreeName", "")
                 field = edu.get("fieldOfStudy", "")
-                if school:
-                    edu_line = f"- {school}"
-                    if degree or field:
-                        edu_line += f": {degree} {field}".strip()
-                    lines.append(edu_line)
-    
-    return "\n".join(lines)
+                if degree or field:
+                    education.append(school + f": {degree} {field}".strip())
+                else:
+                    education.append(school)
+        education = tuple(education)
+    
+    urn_id = get("urn_id") or get("entityUrn", "")
+    
+    return _ProfileView(
+        name=_full_name(profile, mini),
+        headline=get("headline") or get("occupation") or mini.get("occupation", ""),
+        public_id=get("public_id") or get("publicIdentifier", ""),
+        urn_id=urn_id.rpartition(":")[2] if urn_id else "",
+        location=get("locationName") or get("geoLocationName", ""),
+        industry=get("industryName", ""),
+        current=current,
+        summary=get("summary", ""),
+        education=education,
+    )
 
 
-def _format_search_result(result: Dict[str, Any]) -> str:
-    """Format a search result for display."""
-    lines = []
+def _format_profile(profile: Dict[str, Any], verbose: bool = False) -> str:
+    """Format a profile for display."""
+    return "\n".join(_profile_lines(_parse_profile(profile), verbose))
+
+
+def _profile_lines(view: _ProfileView, verbose: bool) -> Iterator[str]:
+    """Yield the non-empty display lines for a parsed profile."""
+    yield f"**{view.name or '(No name)'}**"
+    if view.headline:
+        yield f"_{view.headline}_"
+    
+    if view.public_id:
+        yield f"Public ID: {view.public_id}"
+    if view.urn_id:
+        yield f"URN ID: {view.urn_id}"
+    
+    if view.location:
+        yield f"Location: {view.location}"
+    if view.industry:
+        yield f"Industry: {view.industry}"
+    if view.current:
+        yield f"Current: {view.current}".strip()
+    
+    if not verbose:
+        return
+    
+    summary = view.summary
+    if summary:
+        yield ""
+        yield "**Summary:**"
+        # Truncate long summaries
+        yield summary[:500] + "..." if len(summary) > 500 else summary
+    
+    if view.education is not None:
+        yield ""
+        yield "**Education:**"
+        for line in view.education:
+            yield f"- {line}"
+
+
+def _search_result_lines(result: Dict[str, Any]) -> Iterator[str]:
+    """Yield the non-empty display lines for a search result."""
+    get = result.get
     
     # Handle nested miniProfile structure (from connections)
-    mini = result.get("miniProfile", {})
+    mini = get("miniProfile") or {}
     
     # Name - try multiple sources
-    first_name = result.get("firstName") or mini.get("firstName", "")
-    last_name = result.get("lastName") or mini.get("lastName", "")
-    name = f"{first_name} {last_name}".strip() or "(No name)"
-    
-    # URN - try multiple sources
-    urn_id = result.get("urn_id") or result.get("entityUrn") or mini.get("entityUrn", "")
-    if urn_id and ":" in urn_id:
-        urn_id = urn_id.split(":")[-1]
-    
-    public_id = result.get("public_id") or result.get("publicIdentifier") or mini.get("publicIdentifier", "")
-    
-    lines.append(f"• **{name}**")
+    yield f"• **{_full_name(result, mini) or '(No name)'}**"
     
     # Headline/title - try multiple sources
-    headline = (result.get("headline") or result.get("jobtitle") or 
-                result.get("occupation") or mini.get("occupation", ""))
+    headline = get("headline") or get("jobtitle") or get("occupation") or mini.get("occupation", "")
     if headline:
-        lines.append(f"  {headline}")
+        yield f"  {headline}"
     
     # Location
-    location = result.get("location") or result.get("locationName", "")
+    location = get("location") or get("locationName", "")
     if location:
-        lines.append(f"  📍 {location}")
+        yield f"  📍 {location}"
     
     # IDs
+    public_id = get("public_id") or get("publicIdentifier") or mini.get("publicIdentifier", "")
     if public_id:
-        lines.append(f"  Public ID: {public_id}")
+        yield f"  Public ID: {public_id}"
+    urn_id = get("urn_id") or get("entityUrn") or mini.get("entityUrn", "")
     if urn_id:
-        lines.append(f"  URN ID: {urn_id}")
-    
-    return "\n".join(lines)
+        yield f"  URN ID: {urn_id.rpartition(':')[2]}"
 
 
-def _format_conversation_preview(conv: Dict[str, Any]) -> str:
-    """Format a conversation for the list view."""
-    lines = []
-    
+def _conversation_preview_lines(conv: Dict[str, Any]) -> Iterator[str]:
+    """Yield the non-empty display lines for a conversation preview."""
     # Get participants
-    participants = conv.get("participants", [])
     names = []
-    for p in participants:
-        member = p.get("com.linkedin.voyager.messaging.MessagingMember", {})
-        mini = member.get("miniProfile", {})
-        first = mini.get("firstName", "")
-        last = mini.get("lastName", "")
-        name = f"{first} {last}".strip()
+    for p in conv.get("participants", []):
+        mini = p.get("com.linkedin.voyager.messaging.MessagingMember", {}).get("miniProfile", {})
+        name = _full_name(mini)
         if name:
             names.append(name)
     
@@ -203,81 +451,80 @@ def _format_conversation_preview(conv: Dict[str, Any]) -> str:
     if len(names) > 3:
         participant_str += f" (+{len(names) - 3} more)"
     
-    # Get conversation URN
-    conv_urn = conv.get("entityUrn", "")
-    conv_id = ""
-    if "fs_conversation:" in conv_urn:
-        conv_id = conv_urn.split("fs_conversation:")[-1]
-    
-    # Last activity
-    last_activity = conv.get("lastActivityAt", 0)
-    if last_activity:
-        try:
-            dt = datetime.fromtimestamp(last_activity / 1000)
-            time_str = dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            time_str = ""
-    else:
-        time_str = ""
-    
     # Unread count
     unread = conv.get("unreadCount", 0)
     unread_str = f" 🔴 {unread} unread" if unread > 0 else ""
     
-    lines.append(f"• **{participant_str}**{unread_str}")
+    yield f"• **{participant_str}**{unread_str}"
+    
+    # Last activity
+    time_str = _fmt_ms(conv.get("lastActivityAt", 0))
     if time_str:
-        lines.append(f"  Last activity: {time_str}")
-    if conv_id:
-        lines.append(f"  Conversation ID: {conv_id}")
+        yield f"  Last activity: {time_str}"
     
-    return "\n".join(lines)
+    # Conversation URN
+    conv_urn = conv.get("entityUrn", "")
+    if "fs_conversation:" in conv_urn:
+        conv_id = conv_urn.rpartition("fs_conversation:")[2]
+        if conv_id:
+            yield f"  Conversation ID: {conv_id}"
 
 
-def _format_message(msg: Dict[str, Any]) -> str:
-    """Format a single message."""
-    lines = []
-    
+def _message_lines(msg: Dict[str, Any]) -> Iterator[str]:
+    """Yield the display lines (header, then body) for a message."""
     # Sender
     sender = msg.get("from", {}).get("com.linkedin.voyager.messaging.MessagingMember", {})
     mini = sender.get("miniProfile", {})
-    first = mini.get("firstName", "")
-    last = mini.get("lastName", "")
-    name = f"{first} {last}".strip() or "(Unknown)"
-    
-    # Timestamp
-    timestamp = msg.get("createdAt", 0)
-    if timestamp:
-        try:
-            dt = datetime.fromtimestamp(timestamp / 1000)
-            time_str = dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            time_str = ""
-    else:
-        time_str = ""
-    
-    # Message body
-    event_content = msg.get("eventContent", {})
-    msg_event = event_content.get("com.linkedin.voyager.messaging.event.MessageEvent", {})
-    
-    body = ""
-    attr_body = msg_event.get("attributedBody", {})
-    if attr_body:
-        body = attr_body.get("text", "")
-    if not body:
-        body = msg_event.get("body", "")
+    name = _full_name(mini) or "(Unknown)"
     
-    # Format
+    # Header, with timestamp
     header = f"**{name}**"
+    time_str = _fmt_ms(msg.get("createdAt", 0))
     if time_str:
         header += f" ({time_str})"
+    yield header
     
-    lines.append(header)
-    if body:
-        lines.append(body)
-    else:
-        lines.append("_(No text content)_")
-    
-    return "\n".join(lines)
+    # Message body
+    msg_event = msg.get("eventContent", {}).get("com.linkedin.voyager.messaging.event.MessageEvent", {})
+    body = (msg_event.get("attributedBody") or {}).get("text", "") or msg_event.get("body", "")
+    yield body or "_(No text content)_"
+
+
+def _oldest_first(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order messages by createdAt, oldest first.
+    
+    LinkedIn usually returns threads already sorted (often newest first), so
+    check for that in O(n) before falling back to a stable sort.
+    """
+    timestamps = [e.get("createdAt", 0) for e in elements]
+    steps = list(zip(timestamps, timestamps[1:]))
+    if all(a <= b for a, b in steps):
+        return elements
+    if all(a > b for a, b in steps):
+        # Strictly descending, so reversing matches a stable sort
+        return elements[::-1]
+    order = sorted(range(len(elements)), key=timestamps.__getitem__)
+    return [elements[i] for i in order]
+
+
+# ============ Output Format ============
+# Read-only tools can return the raw LinkedIn data as JSON instead of the
+# Markdown summary, for callers that would otherwise parse the text back
+
+_OUTPUT_FORMAT_DESC = "Output format: 'text' (readable summary, default) or 'json' (raw LinkedIn data)"
+
+
+def _bad_output_format(output_format: str) -> str:
+    """Return an error message if output_format isn't supported, else ""."""
+    if output_format in ("text", "json"):
+        return ""
+    return f"Error: output_format must be 'text' or 'json', got '{output_format}'"
+
+
+def _to_json(data: Any) -> str:
+    """Serialize tool data compactly."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 # ============ Profile Tools (Safe/Read-only) ============
@@ -287,46 +534,51 @@ def _format_message(msg: Dict[str, Any]) -> str:
     public_id="The public profile ID from the LinkedIn URL (e.g., 'john-doe-123456' from linkedin.com/in/john-doe-123456)",
     urn_id="The URN ID (e.g., 'ACoAABxxxx'). Use this if you have it from a previous search.",
     verbose="Whether to include full details like summary and education (default: false)",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
 def get_linkedin_profile(
     public_id: str = "",
     urn_id: str = "",
-    verbose: bool = False
+    verbose: bool = False,
+    output_format: str = "text"
 ) -> str:
     """Get a LinkedIn profile."""
     if not public_id and not urn_id:
         return "Error: Must provide either public_id or urn_id"
+    error = _bad_output_format(output_format)
+    if error:
+        return error
     
-    # Rate limiting
-    if not _profile_limiter.wait():
+    try:
+        profile = _lookup_profile(public_id, urn_id)
+    except _DailyLimitReached:
         remaining = _profile_limiter.get_remaining_today()
         return f"Daily limit reached for profile lookups. Remaining today: {remaining}"
-    
-    try:
-        client = _get_client()
-        profile = client.get_profile(
-            public_id=public_id if public_id else None,
-            urn_id=urn_id if urn_id else None
-        )
-        
-        _profile_limiter.record_success()
-        return _format_profile(profile, verbose=verbose)
-        
     except Exception as e:
-        _profile_limiter.record_failure()
         return f"Error fetching profile: {str(e)}"
+    
+    if output_format == "json":
+        return _to_json(profile)
+    return _format_profile(profile, verbose=verbose)
 
 
 @tool(
     description="Get the authenticated user's own LinkedIn profile.",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
-def get_my_linkedin_profile() -> str:
+def get_my_linkedin_profile(output_format: str = "text") -> str:
     """Get the authenticated user's profile."""
+    error = _bad_output_format(output_format)
+    if error:
+        return error
+    
     try:
         client = _get_client()
         profile = client.get_my_profile()
+        if output_format == "json":
+            return _to_json(profile)
         return _format_profile(profile, verbose=True)
     except Exception as e:
         return f"Error fetching your profile: {str(e)}"
@@ -336,28 +588,32 @@ def get_my_linkedin_profile() -> str:
     description="Get contact information for a LinkedIn profile (email, phone, etc. if available). Note: This only shows info the user has chosen to share.",
     public_id="The public profile ID",
     urn_id="The URN ID",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
 def get_linkedin_contact_info(
     public_id: str = "",
-    urn_id: str = ""
+    urn_id: str = "",
+    output_format: str = "text"
 ) -> str:
     """Get contact info for a profile."""
     if not public_id and not urn_id:
         return "Error: Must provide either public_id or urn_id"
+    error = _bad_output_format(output_format)
+    if error:
+        return error
     
-    if not _profile_limiter.wait():
+    try:
+        info = _lookup_contact_info(public_id, urn_id)
+    except _DailyLimitReached:
         return "Daily limit reached for profile lookups."
+    except Exception as e:
+        return f"Error fetching contact info: {str(e)}"
+    
+    if output_format == "json":
+        return _to_json(info or {})
     
     try:
-        client = _get_client()
-        info = client.get_profile_contact_info(
-            public_id=public_id if public_id else None,
-            urn_id=urn_id if urn_id else None
-        )
-        
-        _profile_limiter.record_success()
-        
         if not info:
             return "No contact information available."
         
@@ -395,70 +651,83 @@ def get_linkedin_contact_info(
         return "\n".join(lines)
         
     except Exception as e:
-        _profile_limiter.record_failure()
         return f"Error fetching contact info: {str(e)}"
 
 
 # ============ Search Tools (Safe/Read-only) ============
 
+# connection_level values accepted by search_linkedin_people -> network depths
+_DEPTH_MAP = MappingProxyType({
+    "1st": ["F"],
+    "1": ["F"],
+    "first": ["F"],
+    "2nd": ["S"],
+    "2": ["S"],
+    "second": ["S"],
+    "3rd": ["O"],
+    "3": ["O"],
+    "third": ["O"],
+})
+
+
 @tool(
     description="Search for people on LinkedIn. Returns matching profiles with their basic info and IDs for further lookup.",
     keywords="Search keywords (e.g., 'software engineer', 'marketing manager')",
     connection_level="Filter by connection level: '1st' (direct connections), '2nd' (friends of friends), '3rd' (everyone else). Leave empty for all.",
     limit="Maximum number of results (default: 10, max: 50)",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
 def search_linkedin_people(
     keywords: str = "",
     connection_level: str = "",
-    limit: int = 10
+    limit: int = 10,
+    output_format: str = "text"
 ) -> str:
     """Search for people on LinkedIn."""
     if not keywords:
         return "Error: Please provide search keywords"
+    error = _bad_output_format(output_format)
+    if error:
+        return error
     
     if not _search_limiter.wait():
         remaining = _search_limiter.get_remaining_today()
         return f"Daily limit reached for searches. Remaining today: {remaining}"
     
     # Map connection level to network depth
-    network_depths = None
-    if connection_level:
-        depth_map = {
-            "1st": ["F"],
-            "1": ["F"],
-            "first": ["F"],
-            "2nd": ["S"],
-            "2": ["S"],
-            "second": ["S"],
-            "3rd": ["O"],
-            "3": ["O"],
-            "third": ["O"],
-        }
-        network_depths = depth_map.get(connection_level.lower())
-    
-    # Cap limit
-    limit = min(limit, 50)
+    network_depths = _DEPTH_MAP.get(connection_level.lower()) if connection_level else None
+    
+    # Cap limit (a non-positive limit would page through every result)
+    limit = max(1, min(limit, 50))
     
     try:
         client = _get_client()
-        results = client.search_people(
+        results = client.iter_search_people(
             keywords=keywords,
             network_depths=network_depths,
             limit=limit
         )
         
+        if output_format == "json":
+            results = list(results)
+            _search_limiter.record_success()
+            return _to_json(results)
+        
+        # Render each page as it arrives; the count header is filled in after
+        output = [f"**Search Results for '{keywords}'**", ""]
+        found = 0
+        for result in results:
+            output.extend(_search_result_lines(result))
+            output.append("")  # Spacing
+            found += 1
+        
         _search_limiter.record_success()
         
-        if not results:
+        if not found:
             return f"No results found for '{keywords}'"
         
-        output = [f"**Search Results for '{keywords}'**"]
-        output.append(f"Found {len(results)} result(s):\n")
-        
-        for result in results:
-            output.append(_format_search_result(result))
-            output.append("")  # Spacing
+        output[1] = f"Found {found} result(s):\n"
         
         # Add note about rate limits
         remaining = _search_limiter.get_remaining_today()
@@ -474,49 +743,71 @@ def search_linkedin_people(
 @tool(
     description="Get your LinkedIn connections. Returns a list of your 1st-degree connections with their basic info.",
     limit="Maximum number of connections to return (default: 50, max: 200)",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
-def get_my_linkedin_connections(limit: int = 50) -> str:
+def get_my_linkedin_connections(limit: int = 50, output_format: str = "text") -> str:
     """Get the user's connections."""
-    if not _profile_limiter.wait():
-        return "Daily limit reached."
+    error = _bad_output_format(output_format)
+    if error:
+        return error
     
-    limit = min(limit, 200)
+    # Cap limit (a non-positive limit would fetch the whole network)
+    limit = max(1, min(limit, 200))
     
     try:
         client = _get_client()
-        connections = client.get_connections(limit=limit)
-        
-        _profile_limiter.record_success()
-        
-        if not connections:
-            return "No connections found."
-        
-        output = [f"**Your LinkedIn Connections**"]
-        output.append(f"Showing {len(connections)} connection(s):\n")
-        
-        for conn in connections:
-            output.append(_format_search_result(conn))
-            output.append("")
-        
-        return "\n".join(output)
-        
+        connections = client.cached_connections(limit=limit)
     except Exception as e:
-        _profile_limiter.record_failure()
         return f"Error fetching connections: {str(e)}"
+    
+    # Only a cache miss costs a rate-limited request
+    if connections is None:
+        if not _profile_limiter.wait():
+            return "Daily limit reached."
+        try:
+            connections = client.get_connections(limit=limit)
+        except Exception as e:
+            _profile_limiter.record_failure()
+            return f"Error fetching connections: {str(e)}"
+        _profile_limiter.record_success()
+    
+    if output_format == "json":
+        return _to_json(connections or [])
+    
+    if not connections:
+        return "No connections found."
+    
+    output = [f"**Your LinkedIn Connections**"]
+    output.append(f"Showing {len(connections)} connection(s):\n")
+    
+    for conn in connections:
+        output.extend(_search_result_lines(conn))
+        output.append("")
+    
+    return "\n".join(output)
 
 
 # ============ Messaging Tools (Read operations - Safe) ============
 
 @tool(
     description="List your LinkedIn conversations (message threads). Shows recent conversations with participants and last activity.",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
-def list_linkedin_conversations() -> str:
+def list_linkedin_conversations(output_format: str = "text") -> str:
     """List all conversations."""
+    error = _bad_output_format(output_format)
+    if error:
+        return error
+    
     try:
         client = _get_client()
         conversations = client.get_conversations()
+        _remember_conversations(conversations or [])
+        
+        if output_format == "json":
+            return _to_json((conversations or [])[:20])
         
         if not conversations:
             return "No conversations found."
@@ -525,7 +816,7 @@ def list_linkedin_conversations() -> str:
         output.append(f"Found {len(conversations)} conversation(s):\n")
         
         for conv in conversations[:20]:  # Limit display to 20
-            output.append(_format_conversation_preview(conv))
+            output.extend(_conversation_preview_lines(conv))
             output.append("")
         
         if len(conversations) > 20:
@@ -540,30 +831,35 @@ def list_linkedin_conversations() -> str:
 @tool(
     description="Get messages from a specific LinkedIn conversation.",
     conversation_id="The conversation ID (from list_linkedin_conversations)",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=True
 )
-def get_linkedin_conversation(conversation_id: str) -> str:
+def get_linkedin_conversation(conversation_id: str, output_format: str = "text") -> str:
     """Get messages from a conversation."""
     if not conversation_id:
         return "Error: Please provide a conversation_id"
+    error = _bad_output_format(output_format)
+    if error:
+        return error
     
     try:
         client = _get_client()
         conversation = client.get_conversation(conversation_id)
         
-        elements = conversation.get("elements", [])
+        # Sort by timestamp (oldest first for reading)
+        elements = _oldest_first(conversation.get("elements", []))
+        
+        if output_format == "json":
+            return _to_json(elements)
         
         if not elements:
             return "No messages in this conversation."
         
-        # Sort by timestamp (oldest first for reading)
-        elements.sort(key=lambda x: x.get("createdAt", 0))
-        
         output = ["**Conversation Messages**"]
         output.append(f"Total: {len(elements)} message(s)\n")
         
         for msg in elements:
-            output.append(_format_message(msg))
+            output.extend(_message_lines(msg))
             output.append("---")
         
         return "\n".join(output)
@@ -594,28 +890,43 @@ def send_linkedin_message(recipient_urn: str, message: str) -> str:
         remaining = _message_limiter.get_remaining_today()
         return f"Daily message limit reached. Remaining today: {remaining}"
     
+    # Post into the thread we already have with them, if we've seen one
+    urn_id = recipient_urn.strip().rpartition(":")[2]
+    conversation_id = _conversation_ids.get(urn_id)
+    
     try:
         client = _get_client()
         
         # Send the message
-        client.send_message(
-            message_body=message,
-            recipients=[recipient_urn]
-        )
+        if conversation_id:
+            client.send_message(
+                message_body=message,
+                conversation_urn_id=conversation_id
+            )
+        else:
+            client.send_message(
+                message_body=message,
+                recipients=[recipient_urn]
+            )
         
         _message_limiter.record_success()
         
         remaining = _message_limiter.get_remaining_today()
+        thread_line = f"Conversation: {conversation_id}\n" if conversation_id else ""
         return (
             f"✅ Message sent successfully!\n"
             f"Recipient URN: {recipient_urn}\n"
+            f"{thread_line}"
             f"Message length: {len(message)} characters\n"
             f"---\n"
             f"_Messages remaining today: {remaining}_"
         )
         
-    except LinkedInMessageError as e:
+    except integrations.LinkedInMessageError as e:
         _message_limiter.record_failure()
+        if conversation_id:
+            # The thread may be gone; start fresh by recipient next time
+            _conversation_ids.pop(urn_id)
         return f"❌ Failed to send message: {str(e)}"
     except Exception as e:
         _message_limiter.record_failure()
@@ -659,7 +970,7 @@ def reply_to_linkedin_conversation(conversation_id: str, message: str) -> str:
             f"_Messages remaining today: {remaining}_"
         )
         
-    except LinkedInMessageError as e:
+    except integrations.LinkedInMessageError as e:
         _message_limiter.record_failure()
         return f"❌ Failed to send reply: {str(e)}"
     except Exception as e:
@@ -672,10 +983,15 @@ def reply_to_linkedin_conversation(conversation_id: str, message: str) -> str:
 @tool(
     description="Get multiple LinkedIn profiles in batch. More efficient than individual lookups. Rate limited to prevent account issues.",
     profile_ids_json="JSON array of profile identifiers. Each item should be an object with 'public_id' and/or 'urn_id'. Example: '[{\"public_id\": \"john-doe\"}, {\"urn_id\": \"ACoAABxxxx\"}]'",
+    output_format=_OUTPUT_FORMAT_DESC,
     safe=False  # Marked unsafe due to batch nature, even though it's read-only
 )
-def batch_get_linkedin_profiles(profile_ids_json: str) -> str:
+def batch_get_linkedin_profiles(profile_ids_json: str, output_format: str = "text") -> str:
     """Batch fetch multiple profiles."""
+    error = _bad_output_format(output_format)
+    if error:
+        return error
+    
     try:
         profiles_to_fetch = json.loads(profile_ids_json)
     except json.JSONDecodeError as e:
@@ -690,39 +1006,78 @@ def batch_get_linkedin_profiles(profile_ids_json: str) -> str:
     if len(profiles_to_fetch) == 0:
         return "Error: No profiles specified"
     
-    client = _get_client()
-    
-    results = []
-    errors = []
-    
-    for i, profile_spec in enumerate(profiles_to_fetch):
+    client = _get_client()  # Fail fast if not authenticated
+    
+    # One short wait for the whole batch instead of a full delay per lookup;
+    # lookups beyond what's left of the daily limit are refused. Items already
+    # cached don't need a reservation.
+    wanted = sum(
+        1 for spec in profiles_to_fetch
+        if (spec.get("public_id") or spec.get("urn_id"))
+        and client.cached_profile(
+            public_id=spec.get("public_id") or None,
+            urn_id=spec.get("urn_id") or None
+        ) is None
+    )
+    reservation = _Reservation(
+        _profile_limiter,
+        _profile_limiter.wait_batch(wanted, min_interval=_BATCH_MIN_INTERVAL) if wanted else 0
+    )
+    limit_reached = threading.Event()
+    
+    def fetch_one(i: int, profile_spec: Dict[str, Any]) -> Tuple[str, Any]:
+        """Look up one batch item, returning (status, profile or error)."""
+        if limit_reached.is_set():
+            return "limit", None
+        
         public_id = profile_spec.get("public_id", "")
         urn_id = profile_spec.get("urn_id", "")
-        
         if not public_id and not urn_id:
-            errors.append(f"Item {i+1}: Missing public_id or urn_id")
-            continue
-        
-        # Rate limiting
-        if not _profile_limiter.wait():
-            errors.append(f"Item {i+1}: Daily limit reached, stopping batch")
-            break
+            return "error", f"Item {i+1}: Missing public_id or urn_id"
         
         try:
-            profile = client.get_profile(
-                public_id=public_id if public_id else None,
-                urn_id=urn_id if urn_id else None
-            )
-            _profile_limiter.record_success()
+            return "ok", _lookup_profile(public_id, urn_id, reservation)
+        except _DailyLimitReached:
+            limit_reached.set()
+            return "limit", None
+        except Exception as e:
+            return "error", f"Item {i+1} ({public_id or urn_id}): {str(e)}"
+    
+    # Lookups overlap their network latency
+    try:
+        with ThreadPoolExecutor(max_workers=_BATCH_CONCURRENCY) as executor:
+            outcomes = list(executor.map(fetch_one, range(len(profiles_to_fetch)), profiles_to_fetch))
+    finally:
+        reservation.release_unused()
+    
+    results = []
+    errors = []
+    limit_reported = False
+    
+    for i, (status, value) in enumerate(outcomes):
+        profile_spec = profiles_to_fetch[i]
+        if status == "ok":
             results.append({
                 "index": i + 1,
-                "public_id": public_id,
-                "urn_id": urn_id,
-                "profile": _format_profile(profile, verbose=False)
+                "public_id": profile_spec.get("public_id", ""),
+                "urn_id": profile_spec.get("urn_id", ""),
+                "profile": value
             })
-        except Exception as e:
-            _profile_limiter.record_failure()
-            errors.append(f"Item {i+1} ({public_id or urn_id}): {str(e)}")
+        elif status == "error":
+            errors.append(value)
+        elif not limit_reported:
+            errors.append(f"Item {i+1}: Daily limit reached, stopping batch")
+            limit_reported = True
+    
+    remaining = _profile_limiter.get_remaining_today()
+    
+    if output_format == "json":
+        return _to_json({
+            "requested": len(profiles_to_fetch),
+            "results": results,
+            "errors": errors,
+            "remaining_today": remaining,
+        })
     
     # Format output
     output = [f"**Batch Profile Results**"]
@@ -730,7 +1085,7 @@ def batch_get_linkedin_profiles(profile_ids_json: str) -> str:
     
     for result in results:
         output.append(f"--- Profile {result['index']} ---")
-        output.append(result["profile"])
+        output.extend(_profile_lines(_parse_profile(result["profile"]), verbose=False))
         output.append("")
     
     if errors:
@@ -738,12 +1093,27 @@ def batch_get_linkedin_profiles(profile_ids_json: str) -> str:
         for error in errors:
             output.append(f"• {error}")
     
-    remaining = _profile_limiter.get_remaining_today()
     output.append(f"\n_Profile lookups remaining today: {remaining}_")
     
     return "\n".join(output)
 
 
+# ============ Cache Tool ============
+
+@tool(
+    description="Clear cached LinkedIn profile and contact info lookups (including remembered not-found errors), so the next lookup fetches fresh data.",
+    safe=True
+)
+def clear_linkedin_cache() -> str:
+    """Clear the lookup caches."""
+    cached = len(_error_cache)
+    _error_cache.clear()
+    _conversation_ids.clear()
+    cached += integrations.clear_linkedin_caches()
+    
+    return f"✅ LinkedIn cache cleared ({cached} cached lookup(s) removed)"
+
+
 # ============ Status Tool ============
 
 @tool(
@@ -762,30 +1132,33 @@ def get_linkedin_rate_limit_status() -> str:
     lines.append("📋 **Profile Lookups**")
     lines.append(f"   Today: {profile_status['operations_today']}/{profile_status['max_per_day']}")
     lines.append(f"   Remaining: {profile_status['remaining_today']}")
+    lines.append(f"   Burst available: {profile_status['burst_available']}")
     lines.append("")
     
     # Search limits
     lines.append("🔍 **Searches**")
     lines.append(f"   Today: {search_status['operations_today']}/{search_status['max_per_day']}")
     lines.append(f"   Remaining: {search_status['remaining_today']}")
+    lines.append(f"   Burst available: {search_status['burst_available']}")
     lines.append("")
     
     # Message limits
     lines.append("💬 **Messages**")
     lines.append(f"   Today: {message_status['operations_today']}/{message_status['max_per_day']}")
     lines.append(f"   Remaining: {message_status['remaining_today']}")
+    lines.append(f"   Burst available: {message_status['burst_available']}")
     lines.append("")
     
     # Note about limits
     lines.append("---")
-    lines.append("_Limits reset at midnight. Conservative limits are enforced to protect your account._")
+    lines.append("_Daily limits apply to a rolling 24-hour window. Conservative limits are enforced to protect your account._")
     
     return "\n".join(lines)
 
 
 # ============ Export Tools List ============
 
-TOOLS: List[RegisteredTool] = [
+TOOLS: Tuple[RegisteredTool, ...] = (
     # Profile tools (safe)
     get_linkedin_profile,
     get_my_linkedin_profile,
@@ -806,7 +1179,8 @@ TOOLS: List[RegisteredTool] = [
     # Batch tools (unsafe due to volume)
     batch_get_linkedin_profiles,
     
-    # Status (safe)
+    # Cache + status (safe)
+    clear_linkedin_cache,
     get_linkedin_rate_limit_status,
-]
+)
 
@@ -5,22 +5,200 @@ Provides two rate limiters:
 1. RateLimiter - Proactive rate limiting with daily limits, jitter, and persistent storage
 2. ReactiveRateLimiter - Reactive rate limiting with exponential backoff
 
+plus TokenBucket, which RateLimiter uses to allow short bursts.
+
 LinkedIn (unofficial API) requires conservative rate limiting to avoid account restrictions.
+
+Persistence: each RateLimiter keeps two files in its storage directory.
+  <name>_rate_limit.json  snapshot of today's counters and the rolling window,
+                          replaced atomically by the shared flush thread
+  <name>_ops.log          append-only "day count timestamp" lines, one per
+                          recorded operation, held open and emptied after
+                          each snapshot
+An operation costs one short append; the snapshot rewrite is batched per
+flush_interval, and startup replays whatever the log holds past it.
 """
 
+import os
 import json
 import time
+import atexit
 import logging
 import random
-from datetime import datetime, date, time as dt_time
+import threading
+import weakref
+from collections import deque
+from datetime import datetime, date, timedelta, time as dt_time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, Optional, Set, Tuple
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to compact JSON bytes (stdlib fallback for orjson.dumps)."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 # Default rate limit storage directory
 DEFAULT_RATE_LIMIT_DIR = Path(__file__).parent.parent / "data" / "rate_limits"
 
+# The "daily" cap applies to any rolling window of this many seconds
+DAILY_WINDOW_SECONDS = 86400
+
+# Storage directories already created by this process
+_ensured_dirs: Set[Path] = set()
+
+
+def _second_of_day(hour_minute: Tuple[int, int]) -> int:
+    """Convert an (hour, minute) time of day to seconds since midnight."""
+    hour, minute = hour_minute
+    return hour * 3600 + minute * 60
+
+
+def _next_midnight_epoch(today: date) -> float:
+    """Get the epoch time of the local midnight that ends the given day."""
+    return datetime.combine(today + timedelta(days=1), dt_time.min).timestamp()
+
+
+# Today's date ordinal and the epoch time it expires, shared by all limiters
+_today_cache = [0, 0.0]
+_today_lock = threading.Lock()
+
+
+def _today_ordinal(now: Optional[float] = None) -> int:
+    """
+    Get today's date as a proleptic Gregorian ordinal, recomputed only after midnight.
+    
+    Args:
+        now: Current time.time(), if the caller already has it
+    """
+    if (time.time() if now is None else now) >= _today_cache[1]:
+        with _today_lock:
+            if time.time() >= _today_cache[1]:
+                today = date.today()
+                # Expiry last, so readers never pair it with a stale date
+                _today_cache[0] = today.toordinal()
+                _today_cache[1] = _next_midnight_epoch(today)
+    return _today_cache[0]
+
+
+def _parse_day(value: Any) -> int:
+    """
+    Read a stored date as an ordinal.
+    
+    Files written before dates were stored as ordinals hold ISO strings.
+    
+    Raises:
+        ValueError: If the value is neither form
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        if value.isdigit():
+            return int(value)
+        return date.fromisoformat(value).toordinal()
+    raise ValueError(f"Invalid date: {value!r}")
+
+
+# One background thread writes out every limiter's pending state, instead of
+# a timer thread per flush. Limiters are held weakly so they can still be
+# garbage collected; a limiter with _flush_due set has a flush pending.
+_limiters: "weakref.WeakSet[RateLimiter]" = weakref.WeakSet()
+_flush_cond = threading.Condition()
+_flush_thread: Optional[threading.Thread] = None
+
+
+def _wake_flusher():
+    """Start the flush thread if needed and have it recheck due times (caller holds _flush_cond)."""
+    global _flush_thread
+    if _flush_thread is None:
+        _flush_thread = threading.Thread(target=_flush_loop, name="rate-limit-flush", daemon=True)
+        _flush_thread.start()
+    _flush_cond.notify()
+
+
+def _flush_loop():
+    """Flush each limiter once its flush_interval has passed since it became dirty."""
+    while True:
+        with _flush_cond:
+            while True:
+                now = time.monotonic()
+                pending = [l for l in _limiters if l._flush_due is not None]
+                due = [l for l in pending if l._flush_due <= now]
+                if due:
+                    break
+                timeout = min((l._flush_due for l in pending), default=now + 60) - now
+                _flush_cond.wait(timeout)
+        
+        # Outside _flush_cond: flush() takes the limiter's lock. One failing
+        # limiter must not take the shared thread down with it.
+        for limiter in due:
+            try:
+                limiter.flush()
+            except Exception as e:
+                logger.error("Error flushing rate limiter %s: %s", limiter.name, e)
+
+
+@atexit.register
+def _close_all():
+    """Write out and close every live limiter at interpreter exit."""
+    with _flush_cond:
+        limiters = list(_limiters)
+    for limiter in limiters:
+        limiter.close()
+
+
+class TokenBucket:
+    """
+    Token bucket allowing bursts of up to `capacity` operations while
+    refilling at a steady `refill_rate` tokens per second.
+    
+    Not thread-safe on its own; RateLimiter guards it with its lock.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    def _refill(self, now: Optional[float] = None):
+        """Add the tokens accrued since the last refill (now is a time.monotonic() reading)."""
+        if now is None:
+            now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def try_acquire(self, now: Optional[float] = None) -> bool:
+        """Consume one token if available, without waiting."""
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+    
+    def halve(self):
+        """Drop half the available tokens (shed load after a failure)."""
+        self._refill()
+        self.tokens /= 2
+    
+    def available(self) -> int:
+        """Number of whole tokens currently available."""
+        self._refill()
+        return int(self.tokens)
+
 
 class RateLimiter:
     """
@@ -30,6 +208,23 @@ class RateLimiter:
     appear human-like in our request patterns.
     """
     
+    __slots__ = (
+        # Configuration
+        "name", "min_delay", "max_delay", "max_per_day", "night_mode",
+        "backoff_factor", "max_backoff_seconds", "flush_interval",
+        "night_start", "morning_start", "_night_start_sec", "_morning_start_sec",
+        # Backoff and spacing
+        "_bucket", "consecutive_failures", "current_backoff",
+        "_lock", "_last_start", "_in_flight", "_last_op_mono",
+        "_tz_offset", "_tz_offset_expiry",
+        # Today's counters and the rolling window
+        "_data_date", "_ops_count", "_last_op_time", "_window",
+        # Persistence
+        "rate_limit_dir", "rate_limit_file", "ops_log_file",
+        "_dirty", "_flush_due", "_log_fh", "_persisted",
+        "__weakref__",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -39,6 +234,8 @@ class RateLimiter:
         night_mode: bool = False,
         backoff_factor: float = 2.0,
         max_backoff_seconds: float = 300.0,
+        burst_capacity: int = 0,
+        flush_interval: float = 5.0,
         storage_dir: Optional[Path] = None
     ):
         """
@@ -48,10 +245,14 @@ class RateLimiter:
             name: Unique name for this rate limiter (used for persistent storage)
             min_delay_seconds: Minimum delay between operations
             max_delay_seconds: Maximum delay between operations (for jitter)
-            max_per_day: Maximum number of operations per day
+            max_per_day: Maximum number of operations in any rolling 24 hours
             night_mode: Whether to pause operations during night hours (00:30-07:30)
             backoff_factor: Multiplier for exponential backoff on failures
             max_backoff_seconds: Maximum backoff delay in seconds
+            burst_capacity: Operations that may run back-to-back without delay,
+                refilled at the daily average rate (0 disables bursting)
+            flush_interval: Seconds to coalesce recorded operations before
+                rewriting the state file
             storage_dir: Directory for persistent storage (defaults to data/rate_limits)
         """
         self.name = name
@@ -62,174 +263,561 @@ class RateLimiter:
         self.backoff_factor = backoff_factor
         self.max_backoff_seconds = max_backoff_seconds
         
+        # Burst allowance, refilled at max_per_day spread over 24 hours
+        self._bucket = (
+            TokenBucket(burst_capacity, max_per_day / 86400)
+            if burst_capacity > 0 else None
+        )
+        
         # Track consecutive failures for backoff
         self.consecutive_failures = 0
         self.current_backoff = min_delay_seconds
         
-        # Night mode time settings (if enabled)
-        self.night_start = dt_time(hour=0, minute=30)   # 00:30
-        self.morning_start = dt_time(hour=7, minute=30)  # 07:30
+        # Serializes wait()/record_*() across threads (wait() sleeps outside
+        # it). _last_start is the time the most recent wait() scheduled an
+        # operation to start - possibly still ahead - so concurrent
+        # callers are spaced out even before the first one records a result;
+        # _in_flight counts operations let through but not yet recorded, so
+        # they count against the daily limit.
+        self._lock = threading.Lock()
+        self._last_start: Optional[float] = None
+        self._in_flight = 0
+        
+        # Monotonic time of the last recorded result. Spacing between
+        # operations is measured on the monotonic clock so wall-clock jumps
+        # (NTP, DST) can't shorten or stretch it; last_operation_time keeps
+        # the wall-clock value for persistence.
+        self._last_op_mono: Optional[float] = None
+        
+        # Start times of successful operations in the last 24 hours, oldest
+        # first. The daily cap is enforced on this rolling window rather than
+        # the calendar day, so there's no burst of capacity at midnight.
+        self._window: Deque[float] = deque()
         
-        # Create rate limit directory
+        # Write-behind persistence: record_*() append to an ops log and mark
+        # the state dirty (as does a day rollover); the shared flush thread
+        # rewrites the state file and compacts the log flush_interval later,
+        # and atexit flushes whatever is pending
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._flush_due: Optional[float] = None
+        self._log_fh = None
+        # _state_key() as of the last write to the state file
+        self._persisted: Optional[tuple] = None
+        
+        # Night mode time settings (if enabled), as (hour, minute)
+        self.night_start = (0, 30)    # 00:30
+        self.morning_start = (7, 30)  # 07:30
+        
+        # The same bounds as seconds since local midnight, plus the local UTC
+        # offset (re-read hourly to follow DST), for the per-wait() check
+        self._night_start_sec = _second_of_day(self.night_start)
+        self._morning_start_sec = _second_of_day(self.morning_start)
+        self._tz_offset = 0
+        self._tz_offset_expiry = 0.0
+        
+        # Create rate limit directory (once per process; limiters share it)
         self.rate_limit_dir = storage_dir or DEFAULT_RATE_LIMIT_DIR
-        self.rate_limit_dir.mkdir(parents=True, exist_ok=True)
+        if self.rate_limit_dir not in _ensured_dirs:
+            self.rate_limit_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(self.rate_limit_dir)
         
         # Initialize rate limiting from persistent storage
         self._init_rate_limiting()
+        # The flush thread iterates _limiters under _flush_cond
+        with _flush_cond:
+            _limiters.add(self)
     
     def _init_rate_limiting(self):
         """Initialize rate limiting data from persistent storage."""
-        self.rate_limit_file = self.rate_limit_dir / f"{self.name}_rate_limit.json"
+        # Plain strings, so open() doesn't go through Path.__fspath__ each time
+        self.rate_limit_file = os.fspath(self.rate_limit_dir / f"{self.name}_rate_limit.json")
+        self.ops_log_file = os.fspath(self.rate_limit_dir / f"{self.name}_ops.log")
         
         # Default rate limit data
-        self.rate_limit_data = {
-            "date": str(date.today()),
-            "operations_count": 0,
-            "last_operation_time": None
+        self._reset_day()
+        
+        # Load existing data if available (open() tells us if it exists).
+        # Nothing is written until the window is complete, further down.
+        loaded_current = False
+        try:
+            with open(self.rate_limit_file, 'rb') as f:
+                stored_data = _loads(f.read())
+            
+            # The rolling window carries across midnight
+            recent = stored_data.get("recent_operations")
+            
+            # Reset counter if it's a new day
+            if _parse_day(stored_data.get("date")) == _today_ordinal():
+                ops_count = int(stored_data.get("operations_count", 0))
+                last_time = stored_data.get("last_operation_time")
+                self._ops_count, self._last_op_time = ops_count, last_time
+                if recent is None and last_time is not None:
+                    # Older state file: assume today's operations were all just now
+                    recent = [last_time] * ops_count
+                # Older state files store the date as a string; rewrite those
+                loaded_current = isinstance(stored_data.get("date"), int)
+            
+            self._window.extend(recent or ())
+            if loaded_current:
+                self._persisted = self._state_key()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error("Error loading rate limit data: %s", e)
+        
+        # Fold in operations logged after the last snapshot, then write the
+        # complete state once (a no-op if the file already holds it) and compact
+        self._replay_ops_log()
+        self._window = deque(sorted(self._window))
+        now = time.time()
+        self._prune_window(now)
+        if self._save_rate_limit_data():
+            self._truncate_ops_log()
+        
+        # Carry the persisted last operation over onto the monotonic clock
+        last_time = self._last_op_time
+        if last_time is not None:
+            self._last_op_mono = time.monotonic() - max(0.0, now - last_time)
+    
+    def _reset_day(self):
+        """Start a fresh day's counters."""
+        self._data_date = _today_ordinal()
+        self._ops_count = 0
+        self._last_op_time = None
+    
+    def _roll_if_new_day(self, now: float) -> bool:
+        """
+        Reset today's counters if the date has changed (caller must hold self._lock).
+        
+        Args:
+            now: Current time.time()
+            
+        Returns:
+            bool: True if a new day was started
+        """
+        if self._data_date == _today_ordinal(now):
+            return False
+        self._reset_day()
+        self._schedule_flush()
+        return True
+    
+    def _state_key(self) -> tuple:
+        """The values that determine whether the state file is current."""
+        window = self._window
+        return (
+            self._data_date, self._ops_count, self._last_op_time,
+            len(window), window[-1] if window else None,
+        )
+    
+    @property
+    def rate_limit_data(self) -> Dict[str, Any]:
+        """Today's counters in the state file's format."""
+        return {
+            "date": self._data_date,
+            "operations_count": self._ops_count,
+            "last_operation_time": self._last_op_time,
         }
+    
+    def _save_rate_limit_data(self) -> bool:
+        """
+        Save rate limiting data to persistent storage.
+        
+        Skips the write if neither the counters nor the rolling window have
+        changed since the last one.
         
-        # Load existing data if available
-        if self.rate_limit_file.exists():
+        Returns:
+            bool: True if the state file is up to date
+        """
+        state_key = self._state_key()
+        if state_key == self._persisted:
+            return True
+        # Machine-read only, so compact
+        data = _dumps({**self.rate_limit_data, "recent_operations": list(self._window)})
+        
+        # Write a temp file and rename it over the old one, so a crash
+        # mid-write can never leave a truncated state file behind
+        tmp_file = self.rate_limit_file + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.rate_limit_file)
+        except OSError as e:
+            logger.error("Error saving rate limit data: %s", e)
+            return False
+        self._persisted = state_key
+        return True
+    
+    def _replay_ops_log(self) -> bool:
+        """
+        Apply the ops log to the rolling window and today's counters.
+        
+        Returns:
+            bool: True if any entries were applied
+        """
+        try:
+            with open(self.ops_log_file, 'r') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error("Error reading rate limit log: %s", e)
+            return False
+        
+        replayed = False
+        for line in lines:
             try:
-                with open(self.rate_limit_file, 'r') as f:
-                    stored_data = json.load(f)
-                
-                # Reset counter if it's a new day
-                if stored_data.get("date") == str(date.today()):
-                    self.rate_limit_data = stored_data
-                else:
-                    # It's a new day, save default data
-                    self._save_rate_limit_data()
-            except Exception as e:
-                logger.error(f"Error loading rate limit data: {e}")
-                self._save_rate_limit_data()
-        else:
-            self._save_rate_limit_data()
+                day, count, timestamp = line.split()
+                day, count, timestamp = _parse_day(day), int(count), float(timestamp)
+            except ValueError:
+                continue  # Torn write from a crash
+            if count:
+                self._window.append(timestamp)
+            if day != self._data_date:
+                continue
+            
+            self._ops_count += count
+            if self._last_op_time is None or timestamp > self._last_op_time:
+                self._last_op_time = timestamp
+            replayed = True
+        
+        return replayed
+    
+    def _log_operation(self, count: int, timestamp: float):
+        """Append an operation to the ops log (caller must hold self._lock)."""
+        try:
+            if self._log_fh is None:
+                self._log_fh = open(self.ops_log_file, 'a')
+            self._log_fh.write(f"{self._data_date} {count} {timestamp}\n")
+            self._log_fh.flush()
+        except Exception as e:
+            logger.error("Error appending to rate limit log: %s", e)
     
-    def _save_rate_limit_data(self):
-        """Save rate limiting data to persistent storage."""
+    def _truncate_ops_log(self):
+        """Empty the ops log once its entries are in the state file."""
         try:
-            with open(self.rate_limit_file, 'w') as f:
-                json.dump(self.rate_limit_data, f, indent=2)
+            if self._log_fh is not None:
+                self._log_fh.seek(0)
+                self._log_fh.truncate()
+            else:
+                open(self.ops_log_file, 'w').close()
         except Exception as e:
-            logger.error(f"Error saving rate limit data: {e}")
+            logger.error("Error compacting rate limit log: %s", e)
+    
+    def _schedule_flush(self):
+        """Mark state dirty and make sure a flush is pending (caller must hold self._lock)."""
+        self._dirty = True
+        if self._flush_due is None:
+            with _flush_cond:
+                self._flush_due = time.monotonic() + self.flush_interval
+                _wake_flusher()
+    
+    def flush(self):
+        """Write pending state to disk now and compact the ops log."""
+        with self._lock:
+            self._flush_due = None
+            if not self._dirty:
+                return
+            # Keep the log if the snapshot couldn't be written
+            if self._save_rate_limit_data():
+                self._truncate_ops_log()
+                self._dirty = False
     
-    def _is_night_time(self) -> bool:
-        """Check if current time is during night hours."""
+    def close(self):
+        """Flush pending state and close the ops log."""
+        self.flush()
+        with self._lock:
+            if self._log_fh is not None:
+                try:
+                    self._log_fh.close()
+                except OSError as e:
+                    logger.error("Error closing rate limit log: %s", e)
+                self._log_fh = None
+    
+    def _is_night_time(self, now: Optional[float] = None) -> bool:
+        """
+        Check if current time is during night hours.
+        
+        Args:
+            now: Current time.time(), if the caller already has it
+        """
         if not self.night_mode:
             return False
-        current_time = datetime.now().time()
-        return self.night_start <= current_time < self.morning_start
+        if now is None:
+            now = time.time()
+        if now >= self._tz_offset_expiry:
+            self._tz_offset = time.localtime(now).tm_gmtoff
+            # DST changes land on an hour boundary
+            self._tz_offset_expiry = (now // 3600 + 1) * 3600
+        second_of_day = int(now + self._tz_offset) % 86400
+        return self._night_start_sec <= second_of_day < self._morning_start_sec
+    
+    def _prune_window(self, now: float):
+        """Drop operations older than the rolling window (caller must hold self._lock)."""
+        cutoff = now - DAILY_WINDOW_SECONDS
+        window = self._window
+        while window and window[0] <= cutoff:
+            window.popleft()
     
     def get_remaining_today(self) -> int:
-        """Get the number of remaining operations for today."""
-        # Refresh data in case date changed
-        if self.rate_limit_data.get("date") != str(date.today()):
-            self.rate_limit_data = {
-                "date": str(date.today()),
-                "operations_count": 0,
-                "last_operation_time": None
-            }
-            self._save_rate_limit_data()
-        
-        return max(0, self.max_per_day - self.rate_limit_data["operations_count"])
+        """Get the number of operations still allowed in the rolling 24-hour window."""
+        # The rolling window doesn't depend on the date; wait() handles rollover
+        with self._lock:
+            self._prune_window(time.time())
+            return max(0, self.max_per_day - len(self._window) - self._in_flight)
     
     def get_operations_today(self) -> int:
         """Get the number of operations performed today."""
-        if self.rate_limit_data.get("date") != str(date.today()):
-            return 0
-        return self.rate_limit_data["operations_count"]
+        # Counters left over from yesterday (no wait() since midnight) read as 0
+        return self._ops_count if self._data_date == _today_ordinal() else 0
     
     def wait(self) -> bool:
         """
         Implement rate limiting logic between operations.
         
+        Thread-safe: concurrent callers wait their turn, and each is spaced
+        from the previous caller's start as well as its last recorded result.
+        The slot is reserved under the lock and the sleep happens outside it,
+        so record_*() and other callers are never blocked by a waiting thread.
+        
         Returns:
             bool: True if the operation should proceed, False if daily limit reached
         """
+        with self._lock:
+            wait_time = self._reserve_locked()
+        if wait_time is None:
+            return False
+        return self._sleep_reserved(wait_time, 1)
+    
+    def _reserve_locked(self) -> Optional[float]:
+        """
+        Reserve one operation slot; caller must hold self._lock.
+        
+        Returns:
+            Optional[float]: Seconds to sleep before starting, or None if refused
+        """
+        # One reading of each clock serves every check below
         current_time = time.time()
+        now_mono = time.monotonic()
         
         # Check if it's a new day - reset counters
-        if self.rate_limit_data.get("date") != str(date.today()):
-            self.rate_limit_data = {
-                "date": str(date.today()),
-                "operations_count": 0,
-                "last_operation_time": None
-            }
-            self._save_rate_limit_data()
+        self._roll_if_new_day(current_time)
         
         # Check night mode restrictions
-        if self._is_night_time():
+        if self._is_night_time(current_time):
             logger.warning(
-                f"Night mode active for {self.name}. "
-                f"Operations paused until 07:30."
+                "Night mode active for %s. Operations paused until %02d:%02d.",
+                self.name, *self.morning_start
             )
-            return False
+            return None
         
-        # Check if we've hit the daily limit
-        if self.rate_limit_data["operations_count"] >= self.max_per_day:
+        # Check if we've hit the daily limit (over the last 24 hours)
+        self._prune_window(current_time)
+        if len(self._window) + self._in_flight >= self.max_per_day:
             logger.warning(
-                f"Daily limit reached for {self.name}: "
-                f"{self.rate_limit_data['operations_count']}/{self.max_per_day} operations"
+                "Daily limit reached for %s: %d/%d operations in the last 24h",
+                self.name, len(self._window) + self._in_flight, self.max_per_day
             )
-            return False
+            return None
+        
+        # Spend a burst token if we have one (not while backing off)
+        if self.consecutive_failures == 0 and self._bucket is not None and self._bucket.try_acquire(now_mono):
+            self._last_start = now_mono
+            self._in_flight += 1
+            return 0.0
         
         # Calculate delay with backoff if there were failures
         base_delay = max(self.min_delay, self.current_backoff)
         
-        if self.rate_limit_data["last_operation_time"] is not None:
-            time_since_last = current_time - self.rate_limit_data["last_operation_time"]
+        wait_time = 0.0
+        last_time = self._last_activity_locked()
+        if last_time is not None:
+            time_since_last = now_mono - last_time
             if time_since_last < base_delay:
                 wait_time = base_delay - time_since_last
                 # Add jitter
                 if self.max_delay > base_delay:
-                    jitter = random.uniform(0, self.max_delay - base_delay)
-                    wait_time += jitter
+                    wait_time += random.random() * (self.max_delay - base_delay)
+        
+        # Claim the slot at its scheduled start so the next caller queues behind it
+        self._last_start = now_mono + wait_time
+        self._in_flight += 1
+        return wait_time
+    
+    def _sleep_reserved(self, wait_time: float, n: int) -> bool:
+        """
+        Sleep off a reservation without holding the lock, then re-check it.
+        
+        Night mode may have started, or a failure may have raised the backoff,
+        while we slept; in the first case the n reserved slots are given back.
+        
+        Args:
+            wait_time: Seconds to sleep before the first re-check
+            n: Number of slots held by the reservation
+            
+        Returns:
+            bool: True if the reserved operations may go ahead
+        """
+        while wait_time > 0:
+            logger.info(
+                "Rate limiting for %s: waiting %.1fs. Operations today: %d/%d",
+                self.name, wait_time, self._ops_count, self.max_per_day
+            )
+            time.sleep(wait_time)
+            
+            with self._lock:
+                current_time = time.time()
+                self._roll_if_new_day(current_time)
+                if self._is_night_time(current_time):
+                    self._in_flight = max(0, self._in_flight - n)
+                    logger.warning(
+                        "Night mode active for %s. Operations paused until %02d:%02d.",
+                        self.name, *self.morning_start
+                    )
+                    return False
                 
-                logger.info(
-                    f"Rate limiting for {self.name}: waiting {wait_time:.1f}s. "
-                    f"Operations today: {self.rate_limit_data['operations_count']}/{self.max_per_day}"
+                wait_time = 0.0
+                if self.consecutive_failures and self._last_op_mono is not None:
+                    now_mono = time.monotonic()
+                    wait_time = self.current_backoff - (now_mono - self._last_op_mono)
+                    if wait_time > 0:
+                        self._last_start = max(self._last_start or 0.0, now_mono + wait_time)
+        return True
+    
+    def _last_activity_locked(self) -> Optional[float]:
+        """Monotonic time of the later of the last result and the last start (caller must hold self._lock)."""
+        last_time = self._last_op_mono
+        if self._last_start is not None and (last_time is None or self._last_start > last_time):
+            last_time = self._last_start
+        return last_time
+    
+    def wait_batch(self, n: int, min_interval: float = 2.0) -> int:
+        """
+        Reserve up to n operations at once, waiting a single short interval.
+        
+        For callers that explicitly asked for a batch: instead of spacing every
+        operation by min_delay, the whole batch waits once (min_interval since
+        the last operation, or the failure backoff if larger) and then runs
+        without further delays. The daily cap still applies - only as many
+        operations as remain in the rolling window are granted.
+        
+        Reserved operations count as in flight: each one must be followed by
+        record_success() or record_failure(), and any left unused given back
+        with release().
+        
+        Args:
+            n: Number of operations wanted
+            min_interval: Seconds to keep between the previous operation and the batch
+            
+        Returns:
+            int: Number of operations granted (0 if none may run now)
+        """
+        with self._lock:
+            current_time = time.time()
+            
+            # Check if it's a new day - reset counters
+            self._roll_if_new_day(current_time)
+            
+            if self._is_night_time(current_time):
+                logger.warning(
+                    "Night mode active for %s. Operations paused until %02d:%02d.",
+                    self.name, *self.morning_start
+                )
+                return 0
+            
+            self._prune_window(current_time)
+            granted = min(n, self.max_per_day - len(self._window) - self._in_flight)
+            if granted <= 0:
+                logger.warning(
+                    "Daily limit reached for %s: %d/%d operations in the last 24h",
+                    self.name, len(self._window) + self._in_flight, self.max_per_day
                 )
-                time.sleep(wait_time)
+                return 0
+            
+            interval = min_interval
+            if self.consecutive_failures:
+                interval = max(interval, self.current_backoff)
+            
+            wait_time = 0.0
+            last_time = self._last_activity_locked()
+            now_mono = time.monotonic()
+            if last_time is not None and now_mono - last_time < interval:
+                wait_time = interval - (now_mono - last_time)
+            
+            self._last_start = now_mono + wait_time
+            self._in_flight += granted
         
-        return True
+        return granted if self._sleep_reserved(wait_time, granted) else 0
+    
+    def release(self, n: int = 1):
+        """Give back operations reserved by wait_batch() that were never run."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - n)
     
     def record_success(self):
         """Record a successful operation and reset backoff."""
+        with self._lock:
+            self._record_success_locked()
+    
+    def _record_success_locked(self):
+        """Body of record_success(); caller must hold self._lock."""
+        self._in_flight = max(0, self._in_flight - 1)
         self.consecutive_failures = 0
         self.current_backoff = self.min_delay
         
         # Update rate limit data
-        self.rate_limit_data["last_operation_time"] = time.time()
-        self.rate_limit_data["operations_count"] += 1
-        self._save_rate_limit_data()
+        now = time.time()
+        self._last_op_mono = time.monotonic()
+        self._last_op_time = now
+        self._ops_count += 1
+        self._window.append(now)
+        self._log_operation(1, now)
+        self._schedule_flush()
         
-        logger.debug(
-            f"Operation recorded for {self.name}. "
-            f"Total today: {self.rate_limit_data['operations_count']}/{self.max_per_day}"
-        )
+        # Hot path, and almost always filtered out
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Operation recorded for %s. Total today: %d/%d",
+                self.name, self._ops_count, self.max_per_day
+            )
     
     def record_failure(self):
         """Record a failed operation and increase backoff."""
+        with self._lock:
+            self._record_failure_locked()
+    
+    def _record_failure_locked(self):
+        """Body of record_failure(); caller must hold self._lock."""
+        self._in_flight = max(0, self._in_flight - 1)
         self.consecutive_failures += 1
         
-        # Exponential backoff with maximum limit
+        # Jittered exponential backoff with maximum limit, so concurrent
+        # clients don't retry in lockstep
         self.current_backoff = min(
-            self.current_backoff * self.backoff_factor,
+            self.current_backoff * self.backoff_factor * (0.5 + random.random()),
             self.max_backoff_seconds
         )
         
-        self.rate_limit_data["last_operation_time"] = time.time()
-        self._save_rate_limit_data()
+        # Shed load: a failure halves the remaining burst allowance
+        if self._bucket is not None:
+            self._bucket.halve()
+        
+        now = time.time()
+        self._last_op_mono = time.monotonic()
+        self._last_op_time = now
+        self._log_operation(0, now)
+        self._schedule_flush()
         
         logger.warning(
-            f"Operation failed for {self.name}. "
-            f"Consecutive failures: {self.consecutive_failures}. "
-            f"Next backoff delay: {self.current_backoff:.1f}s"
+            "Operation failed for %s. Consecutive failures: %d. Next backoff delay: %.1fs",
+            self.name, self.consecutive_failures, self.current_backoff
         )
     
     def get_status(self) -> Dict[str, Any]:
         """Get current rate limiter status."""
+        with self._lock:
+            burst_available = self._bucket.available() if self._bucket is not None else 0
+        
         return {
             "name": self.name,
             "operations_today": self.get_operations_today(),
@@ -237,6 +825,7 @@ class RateLimiter:
             "remaining_today": self.get_remaining_today(),
             "current_backoff": self.current_backoff,
             "consecutive_failures": self.consecutive_failures,
+            "burst_available": burst_available,
             "night_mode": self.night_mode,
             "is_night_time": self._is_night_time(),
         }
@@ -285,6 +874,9 @@ class ReactiveRateLimiter:
         self._retry_count = 0
         self._has_had_failures = False
         self._consecutive_successes = 0
+        
+        # True while no failures are outstanding, so wait() is one check
+        self._fast_ok = max_retries > 0
     
     def wait(self) -> bool:
         """
@@ -294,14 +886,14 @@ class ReactiveRateLimiter:
         Returns:
             bool: True if operation should proceed, False if max retries exceeded
         """
-        if self.exceeded_max_retries():
-            return False
-        
-        if not self._has_had_failures:
+        if self._fast_ok:
             return True
         
+        if self._retry_count >= self.max_retries:
+            return False
+        
         if self.current_backoff > 0:
-            logger.info(f"Rate limiting for {self.name}: waiting {self.current_backoff:.1f}s")
+            logger.info("Rate limiting for %s: waiting %.1fs", self.name, self.current_backoff)
             time.sleep(self.current_backoff)
         
         return True
@@ -317,17 +909,20 @@ class ReactiveRateLimiter:
                 self.current_backoff = 0
             
             if self.current_backoff > 0:
-                logger.debug(
-                    f"Reducing backoff for {self.name} to {self.current_backoff:.1f}s"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Reducing backoff for %s to %.1fs", self.name, self.current_backoff
+                    )
             elif self._consecutive_successes >= 3:
                 self._has_had_failures = False
                 self._retry_count = 0
-                logger.debug(f"Backoff fully recovered for {self.name}")
+                self._fast_ok = self.max_retries > 0
+                logger.debug("Backoff fully recovered for %s", self.name)
     
     def record_failure(self):
         """Record a rate limit failure and increase backoff."""
         self._has_had_failures = True
+        self._fast_ok = False
         self._retry_count += 1
         self._consecutive_successes = 0
         
@@ -340,9 +935,8 @@ class ReactiveRateLimiter:
             )
         
         logger.warning(
-            f"Rate limit hit for {self.name}. "
-            f"Retry {self._retry_count}/{self.max_retries}. "
-            f"Backoff: {self.current_backoff:.1f}s"
+            "Rate limit hit for %s. Retry %d/%d. Backoff: %.1fs",
+            self.name, self._retry_count, self.max_retries, self.current_backoff
         )
     
     def exceeded_max_retries(self) -> bool:
@@ -355,6 +949,7 @@ class ReactiveRateLimiter:
         self._has_had_failures = False
         self.current_backoff = 0
         self._consecutive_successes = 0
+        self._fast_ok = self.max_retries > 0
     
     def get_status(self) -> Dict[str, Any]:
         """Get current rate limiter status."""